@@ -1,43 +1,125 @@
 import os
 import sys
+import time
+STARTUP_TIME = time.perf_counter()
+import argparse
 import pygame
 import json
+import random
+PYGAME_IMPORTED = time.perf_counter()
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.checkword import WordChecker
-from ui.page.game_ui import GameScreen
-from ui.page.main_page import MainPage
-from ui.page.splash_screen import SplashScreen
-from ui.page.character_select import CharacterSelectScreen
+from utils.startup import StartupProfiler
+
+# Pages, PIL (via the lava) and enchant (via the word checker) are imported on first use
+
+def start_recorder(record_dir, character, seed, screen_width, screen_height):
+    """Open an input recording for a new game session (None if disabled)"""
+    if not record_dir:
+        return None
+    from utils.replay import InputRecorder
+    os.makedirs(record_dir, exist_ok=True)
+    path = os.path.join(record_dir, f"session_{int(time.time() * 1000)}.todr")
+    return InputRecorder(path, {"character": character, "seed": seed, "screen": [screen_width, screen_height]})
 
 def main():
     """Main game loop - acts as a layout/container"""
+    parser = argparse.ArgumentParser(description="TextOrDeath client")
+    parser.add_argument("--record", metavar="DIR", help="record every game session into DIR for utils/replay.py")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report import/init times up to the first frame and exit 1 if over client.startup_budget_ms")
+    parser.add_argument("--track-surfaces", action="store_true",
+                        help="debug: report surface memory per screen on every return to the menu and warn on growth")
+    args = parser.parse_args()
+
+    profiler = StartupProfiler(args.profile_startup, STARTUP_TIME)
+    profiler.record("import", "pygame", STARTUP_TIME, PYGAME_IMPORTED)
+
     # Load config
-    with open("config.json", "r") as f:
-        default_data = json.load(f)
+    with profiler.phase("config.json"):
+        with open("config.json", "r") as f:
+            default_data = json.load(f)
+
+    # Fail before the window opens rather than when the first game starts
+    dictionary = default_data.get("dictionary", {})
+    if dictionary.get("backend") == "wordlist":
+        from utils.checkword import WordChecker
+        try:
+            WordChecker.require_wordlist(dictionary.get("wordlist"))
+        except FileNotFoundError as e:
+            print(e)
+            sys.exit(1)
 
     screen_width = int(default_data["client"]["screen_width"])
     screen_height = int(default_data["client"]["screen_height"])
 
     # Initialize pygame
-    pygame.init()
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("TextOrDeath")
+    # screen_width/screen_height are the logical canvas every page draws into;
+    # with "scaled" SDL stretches it to the window once per frame on the GPU
+    with profiler.phase("pygame.init"):
+        pygame.init()
+    surface_tracker = None
+    if args.track_surfaces:
+        # Installed before any page exists so their surfaces are tracked from the start
+        from utils.surface_tracker import SurfaceTracker
+        surface_tracker = SurfaceTracker()
+        surface_tracker.install()
+    display_flags = 0
+    if default_data["client"].get("scaled", True):
+        display_flags |= pygame.SCALED
+    if default_data["client"].get("fullscreen", False):
+        display_flags |= pygame.FULLSCREEN
+    with profiler.phase("display.set_mode"):
+        screen = pygame.display.set_mode((screen_width, screen_height), display_flags)
+        pygame.display.set_caption("TextOrDeath")
 
     # Show splash screen
-    splash = SplashScreen(screen, logo_path='assets/logo/logopygame.png', duration=2000)
+    SplashScreen = profiler.load("ui.page.splash_screen", "SplashScreen")
+    with profiler.phase("SplashScreen"):
+        splash = SplashScreen(screen, logo_path='assets/logo/logopygame.png', duration=2000)
+
+    if args.profile_startup:
+        # Only the first splash frame counts; skip the fade animation
+        splash.draw(255)
+        pygame.display.flip()
+        profiler.mark_first_frame()
+
+        # Report what the rest of startup would cost once the splash is up
+        MainPage = profiler.load("ui.page.main_page", "MainPage")
+        profiler.load("ui.page.character_select", "CharacterSelectScreen")
+        profiler.load("ui.page.game_ui", "GameScreen")
+        with profiler.phase("MainPage"):
+            MainPage(screen, 'assets/fonts/Parkinsans-Regular.ttf', screen_width, screen_height)
+
+        budget_ms = default_data["client"].get("startup_budget_ms", 1000)
+        within_budget = profiler.report(budget_ms)
+        pygame.quit()
+        sys.exit(0 if within_budget else 1)
+
     if not splash.show():  # ถ้า user กด quit ระหว่าง splash
         pygame.quit()
         return
 
-    # Initialize word checker
-    word_checker = WordChecker("en_US")
+    from utils.validator import AnswerValidator
+    from utils.score_store import ScoreStore
+    from utils.telemetry import AnswerTelemetry
+    from utils.frame_governor import FrameGovernor
+    fps = int(default_data["client"].get("fps", 60))
+    governor = FrameGovernor(fps, enabled=default_data["client"].get("adaptive_quality", True))
+    validator = AnswerValidator(default_data["client"].get("validation_workers", 1))
+    score_store = ScoreStore(default_data["client"].get("score_db", "scores.db"))
+    telemetry = AnswerTelemetry(default_data["client"].get("telemetry_log", "logs/answers.bin"))
     font3 = 'assets/fonts/Parkinsans-Regular.ttf'
 
-    # Initialize pages
+    # Initialize pages (character select and game are built when first shown,
+    # then kept and re-entered instead of being rebuilt)
+    MainPage = profiler.load("ui.page.main_page", "MainPage")
     main_page = MainPage(screen, font3, screen_width, screen_height)
-    character_select = CharacterSelectScreen(screen, font3, screen_width, screen_height)
+    if surface_tracker:
+        surface_tracker.checkpoint("startup", {"main": main_page})
+    character_select = None
     game_screen = None
     selected_character = None
+    recorder = None
 
     # Main game loop
     game_run = True
@@ -53,25 +135,48 @@ def main():
             if current_screen == "main":
                 if event.type == pygame.KEYDOWN:
                     # Go to character select
+                    main_page.exit()
+                    if character_select is None:
+                        CharacterSelectScreen = profiler.load("ui.page.character_select", "CharacterSelectScreen")
+                        character_select = CharacterSelectScreen(screen, font3, screen_width, screen_height)
+                    character_select.enter()
                     current_screen = "character_select"
             
             elif current_screen == "character_select":
                 result = character_select.handle_event(event)
                 if result and result != False:
+                    character_select.exit()
                     if result == "back":
+                        main_page.enter()
                         current_screen = "main"
                     else:
                         # Character selected, start game
                         selected_character = result
-                        game_screen = GameScreen(screen, word_checker, default_data, font3, selected_character)
+                        if game_screen is None:
+                            from utils.checkword import WordChecker
+                            word_checker = WordChecker.from_config(default_data)
+                            GameScreen = profiler.load("ui.page.game_ui", "GameScreen")
+                            game_screen = GameScreen(screen, word_checker, default_data, font3, selected_character, validator,
+                                                     score_store=score_store, telemetry=telemetry)
+                            game_screen.set_quality(governor.preset)
+                        seed = random.getrandbits(32)
+                        recorder = start_recorder(args.record, selected_character, seed, screen_width, screen_height)
+                        game_screen.enter(selected_character, recorder, seed)
                         current_screen = "game"
             
             elif current_screen == "game":
                 result = game_screen.handle_event(event)
                 if result == "menu":
-                    # Return to main page
+                    # Return to main page (the game screen is kept for the next round)
+                    game_screen.exit()
+                    if recorder:
+                        recorder.close()
+                        recorder = None
+                    main_page.enter()
                     current_screen = "main"
-                    game_screen = None
+                    if surface_tracker:
+                        surface_tracker.checkpoint("menu", {"main": main_page, "character_select": character_select,
+                                                            "game": game_screen})
                 elif not result:
                     # Quit game
                     game_run = False
@@ -87,8 +192,23 @@ def main():
             game_screen.render()
 
         pygame.display.flip()
-        clock.tick(60)
+        if current_screen == "game":
+            game_screen.input_latency.presented()
+        clock.tick(fps)
+
+        # get_rawtime() is the last frame's work without the tick's sleep
+        if governor.add_frame(clock.get_rawtime()):
+            print(f"Quality level {governor.level} (p90 frame {governor.slow_frame_ms:.1f} ms, budget {governor.budget_ms:.1f} ms)")
+            if game_screen is not None:
+                game_screen.set_quality(governor.preset)
 
+    if current_screen == "game":
+        game_screen.exit()
+    if recorder:
+        recorder.close()
+    validator.close()
+    score_store.close()
+    telemetry.close()
     pygame.quit()
 
 if __name__ == "__main__":
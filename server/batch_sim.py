@@ -0,0 +1,139 @@
+import numpy as np
+
+# Tower/lava geometry mirrored from the client (logical pixels)
+SCREEN_HEIGHT = 768
+BLOCK_STEP = 34          # block_height + block_spacing in BlockManager
+BLOCK_BASE_Y = SCREEN_HEIGHT - 60
+MIN_TOP_Y = 180
+CHARACTER_FOOT_OFFSET = 50  # character bottom relative to the top block
+LAVA_SPEED = 30.0        # px per second (0.5 px per frame at 60 FPS)
+
+
+class BatchSimulation:
+    def __init__(self, capacity=64, max_players=4):
+        """
+        Lava, towers and question timers of every room in NumPy arrays.
+
+        Rooms own a row (slot) and players a column inside it; step()
+        advances, collides and expires all rooms with a handful of
+        vectorised operations, whatever the number of rooms.
+        """
+        self.max_players = max_players
+        self.capacity = 0
+        self.free_slots = []
+
+        # Per room
+        self.active = np.zeros(0, dtype=bool)
+        self.finished = np.zeros(0, dtype=bool)
+        self.rising = np.zeros(0, dtype=bool)
+        self.lava_speed = np.zeros(0)
+        self.time_remaining = np.zeros(0)
+
+        # Per player (room slot x player column)
+        self.occupied = np.zeros((0, max_players), dtype=bool)
+        self.alive = np.zeros((0, max_players), dtype=bool)
+        self.lava_y = np.zeros((0, max_players))
+        self.blocks = np.zeros((0, max_players), dtype=np.int32)
+        self.total_blocks = np.zeros((0, max_players), dtype=np.int32)
+
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Resize every array to hold capacity rooms"""
+        extra = capacity - self.capacity
+        for name in ("active", "finished", "rising", "lava_speed", "time_remaining",
+                     "occupied", "alive", "lava_y", "blocks", "total_blocks"):
+            array = getattr(self, name)
+            padding = np.zeros((extra,) + array.shape[1:], dtype=array.dtype)
+            setattr(self, name, np.concatenate([array, padding]))
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def add_room(self, round_time):
+        """Reserve a slot for a new room and return it"""
+        if not self.free_slots:
+            self._grow(max(1, self.capacity * 2))
+        slot = self.free_slots.pop()
+        self.active[slot] = True
+        self.finished[slot] = False
+        self.rising[slot] = False
+        self.lava_speed[slot] = LAVA_SPEED
+        self.time_remaining[slot] = round_time
+        self.occupied[slot] = False
+        self.alive[slot] = False
+        return slot
+
+    def restart_room(self, slot, round_time):
+        """Start a finished room over; everyone still seated gets a fresh tower and lava"""
+        self.finished[slot] = False
+        self.rising[slot] = False
+        self.time_remaining[slot] = round_time
+        seated = self.occupied[slot]
+        self.alive[slot] = seated
+        self.lava_y[slot, seated] = SCREEN_HEIGHT
+        self.blocks[slot, seated] = 0
+        self.total_blocks[slot, seated] = 0
+
+    def remove_room(self, slot):
+        self.active[slot] = False
+        self.occupied[slot] = False
+        self.alive[slot] = False
+        self.free_slots.append(slot)
+
+    def add_player(self, slot):
+        """Seat a player in a room; returns its column or None if the room is full"""
+        free = np.flatnonzero(~self.occupied[slot])
+        if len(free) == 0:
+            return None
+        column = int(free[0])
+        self.occupied[slot, column] = True
+        self.alive[slot, column] = True
+        self.lava_y[slot, column] = SCREEN_HEIGHT
+        self.blocks[slot, column] = 0
+        self.total_blocks[slot, column] = 0
+        return column
+
+    def remove_player(self, slot, column):
+        self.occupied[slot, column] = False
+        self.alive[slot, column] = False
+
+    def add_word(self, slot, column, length):
+        """A correct answer: grow the tower and push the lava back down"""
+        self.blocks[slot, column] += length
+        self.total_blocks[slot, column] += length
+        self.lava_y[slot, column] = min(SCREEN_HEIGHT, self.lava_y[slot, column] + length * BLOCK_STEP)
+
+    def start_question(self, slot, round_time, rising):
+        self.time_remaining[slot] = round_time
+        self.rising[slot] = rising
+
+    def step(self, dt):
+        """
+        Advance every active room by dt seconds
+        Returns: slots of rooms that lost a player or finished this tick
+        """
+        running = self.active & ~self.finished
+        has_players = self.occupied.any(axis=1)
+        alive_before = self.alive.copy()
+
+        # Lava rises for living players of rooms past the first questions
+        moving = self.alive & (running & self.rising)[:, None]
+        self.lava_y -= moving * (self.lava_speed * dt)[:, None]
+
+        # Collision with each character's feet (towers capped like BlockManager)
+        top_y = np.maximum(MIN_TOP_Y, BLOCK_BASE_Y - self.blocks * BLOCK_STEP)
+        self.alive &= ~((top_y + CHARACTER_FOOT_OFFSET) >= self.lava_y)
+
+        # Question timers (paused while a room only has spectators)
+        timing = running & has_players
+        self.time_remaining -= timing * dt
+        np.maximum(self.time_remaining, 0.0, out=self.time_remaining)
+        expired = timing & (self.time_remaining <= 0)
+        self.alive[expired] = False
+
+        # A room with players finishes when none of them is alive
+        newly_finished = running & has_players & ~self.alive.any(axis=1)
+        self.finished |= newly_finished
+
+        changed = (alive_before != self.alive).any(axis=1) | newly_finished
+        return np.flatnonzero(changed & self.active)
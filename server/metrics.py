@@ -0,0 +1,216 @@
+import asyncio
+import bisect
+import os
+import time
+
+# Default histogram buckets in seconds (tick and check times are sub-millisecond to tens of ms)
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape_label_value(value):
+    """Escape backslash, double quote and newline as the text exposition format requires"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+class _Metric:
+    def __init__(self, name, help_text, kind):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.children = {}  # sorted label tuple -> child
+
+    def labels(self, **labels):
+        """Return the child for a label set (create it on first use)"""
+        key = tuple(sorted(labels.items()))
+        child = self.children.get(key)
+        if child is None:
+            child = self.children[key] = self._new_child()
+        return child
+
+    def remove(self, **labels):
+        """Forget a label set (e.g. when a room closes)"""
+        self.children.pop(tuple(sorted(labels.items())), None)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for labels, child in self.children.items():
+            lines.extend(child.render(self.name, labels))
+        return lines
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def set(self, value):
+        self.value = value
+
+    def set_function(self, function):
+        """Compute the value at scrape time instead of on every change"""
+        self.function = function
+
+    def render(self, name, labels):
+        value = self.function() if self.function else self.value
+        return [f"{name}{_format_labels(labels)} {value}"]
+
+
+class Counter(_Metric):
+    def __init__(self, name, help_text):
+        super().__init__(name, help_text, "counter")
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    def __init__(self, name, help_text):
+        super().__init__(name, help_text, "gauge")
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value):
+        self.labels().set(value)
+
+    def set_function(self, function):
+        self.labels().set_function(function)
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self):
+        """Context manager observing the duration of its block"""
+        return _Timer(self)
+
+    def render(self, name, labels):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {self.sum}")
+        lines.append(f"{name}_count{_format_labels(labels)} {self.count}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class Histogram(_Metric):
+    def __init__(self, name, help_text, buckets=TIME_BUCKETS):
+        super().__init__(name, help_text, "histogram")
+        self.buckets = tuple(buckets)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+
+def _rss_bytes():
+    """Resident memory of this process (0 where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+class ServerMetrics:
+    def __init__(self):
+        """All metrics exported by one server worker"""
+        self.tick_duration = Histogram("tod_tick_duration_seconds", "Time spent in one server tick")
+        self.room_broadcast = Histogram("tod_room_broadcast_seconds", "Snapshot encode and broadcast time per changed room")
+        self.loop_lag = Histogram("tod_event_loop_lag_seconds", "Delay of the event loop behind schedule")
+        self.messages_in = Counter("tod_messages_in_total", "Messages received from clients")
+        self.messages_out = Counter("tod_messages_out_total", "Messages sent to clients")
+        self.socket_writes = Counter("tod_socket_writes_total", "transport.write calls (one per client per tick)")
+        self.dropped_snapshots = Counter("tod_dropped_snapshots_total", "Snapshots replaced before a slow client could receive them")
+        self.outbound_bytes = Gauge("tod_outbound_buffered_bytes", "Bytes queued for all clients")
+        self.answer_check = Histogram("tod_answer_check_seconds", "Latency of answer validation")
+        self.players = Gauge("tod_connected_players", "Connected players")
+        self.rooms = Gauge("tod_rooms", "Open rooms")
+        self.memory = Gauge("tod_worker_resident_memory_bytes", "Resident memory per worker")
+        self.memory.labels(pid=os.getpid()).set_function(_rss_bytes)
+
+        self.metrics = [self.tick_duration, self.room_broadcast, self.loop_lag, self.messages_in,
+                        self.messages_out, self.socket_writes, self.dropped_snapshots, self.outbound_bytes,
+                        self.answer_check, self.players, self.rooms, self.memory]
+
+    def render(self):
+        """Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    async def sample_loop_lag(self, interval=0.5):
+        """Background task measuring how late the event loop wakes up"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.loop_lag.observe(max(0.0, loop.time() - expected))
+
+    async def _handle_http(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Drain headers
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                body = self.render().encode("utf-8")
+                status = "200 OK"
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                body = b"not found\n"
+                status = "404 Not Found"
+                content_type = "text/plain"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=9188):
+        """Serve GET /metrics on a local port and start the loop lag sampler"""
+        self.lag_task = asyncio.create_task(self.sample_loop_lag())
+        return await asyncio.start_server(self._handle_http, host, port)
@@ -0,0 +1,336 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+MAGIC = b"TODQ"
+FORMAT_VERSION = 2
+# magic, format version, bank version, question count, source sha256, bucket table offset, bucket count
+HEADER = struct.Struct("<4sIII32sII")
+QUESTION = struct.Struct("<IIIIII")  # text offset/length, difficulty offset/length, first answer, answer count
+BUCKET = struct.Struct("<IIII")      # difficulty offset/length, first index, index count
+OFFSET = struct.Struct("<I")
+CURRENT = "CURRENT"  # pointer file naming the published bank
+LOCK = "compile.lock"
+STALE_LOCK_SECONDS = 60  # a lock this old was left by a worker that died while compiling
+
+
+def normalise_answer(text):
+    """The form answers are compiled in and submissions are looked up with"""
+    return text.strip().lower()
+
+
+def compile_bank(questions, output_path, version, source_hash=b""):
+    """
+    Compile a question list (database.json format) into a bank file.
+
+    Layout: header, one QUESTION entry per question, (answers + 1) uint32
+    offsets, the strings, then one BUCKET entry per difficulty followed by
+    the uint32 question indices of every bucket. Each question's answers
+    are normalised, de-duplicated and sorted so lookups can binary search
+    them in place. A bank without difficulties has no buckets.
+    Returns the number of questions written.
+    """
+    strings = bytearray()
+
+    def add_string(data):
+        offset = len(strings)
+        strings.extend(data)
+        return offset
+
+    entries = []
+    answers = []
+    buckets = {}  # difficulty -> question indices
+    for index, question in enumerate(questions):
+        text = question["question"].encode("utf-8")
+        difficulty = question.get("difficulty")
+        difficulty = b"" if difficulty is None else str(difficulty).encode("utf-8")
+        buckets.setdefault(difficulty, []).append(index)
+        normalised = sorted({normalise_answer(answer).encode("utf-8") for answer in question["answer"]})
+        normalised = [answer for answer in normalised if answer]
+        entries.append((add_string(text), len(text), add_string(difficulty), len(difficulty),
+                        len(answers), len(normalised)))
+        answers.extend(normalised)
+
+    answer_offsets = [len(strings)]
+    for answer in answers:
+        strings.extend(answer)
+        answer_offsets.append(len(strings))
+
+    if list(buckets) == [b""]:
+        buckets = {}  # no difficulties: rooms draw from range(count)
+    bucket_entries = []
+    bucket_indices = []
+    for difficulty, indices in buckets.items():
+        bucket_entries.append((add_string(difficulty), len(difficulty), len(bucket_indices), len(indices)))
+        bucket_indices.extend(indices)
+
+    bucket_table = (HEADER.size + len(entries) * QUESTION.size + len(answer_offsets) * OFFSET.size
+                    + len(strings))
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, version, len(entries), source_hash,
+                            bucket_table, len(bucket_entries)))
+        for entry in entries:
+            f.write(QUESTION.pack(*entry))
+        f.write(struct.pack(f"<{len(answer_offsets)}I", *answer_offsets))
+        f.write(strings)
+        for entry in bucket_entries:
+            f.write(BUCKET.pack(*entry))
+        f.write(struct.pack(f"<{len(bucket_indices)}I", *bucket_indices))
+    os.replace(tmp_path, output_path)
+    return len(entries)
+
+
+class CompiledQuestionBank:
+    def __init__(self, path):
+        """
+        Memory-map a bank produced by compile_bank.
+
+        The file is mapped read-only, so every worker that opens the same
+        version shares its pages through the OS page cache. A mapping stays
+        valid after a newer version is published, which is what lets running
+        rooms keep the bank they started with.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, version, count, source_hash, bucket_table, bucket_count = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a compiled question bank")
+
+        self.version = version
+        self.count = count
+        self.source_hash = source_hash
+        self._bucket_table = bucket_table
+        self._bucket_count = bucket_count
+        self._questions_start = HEADER.size
+        self._offsets_start = HEADER.size + count * QUESTION.size
+        last_question = QUESTION.unpack_from(self._map, self._offsets_start - QUESTION.size) if count else (0,) * 6
+        answer_count = last_question[4] + last_question[5]
+        self._strings_start = self._offsets_start + (answer_count + 1) * OFFSET.size
+
+    def _entry(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return QUESTION.unpack_from(self._map, self._questions_start + index * QUESTION.size)
+
+    def _string(self, offset, length):
+        start = self._strings_start + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _answer_at(self, index):
+        start, end = struct.unpack_from("<II", self._map, self._offsets_start + index * OFFSET.size)
+        return self._map[self._strings_start + start:self._strings_start + end]
+
+    def question(self, index):
+        text_offset, text_length = self._entry(index)[:2]
+        return self._string(text_offset, text_length)
+
+    def difficulty(self, index):
+        _, _, offset, length, _, _ = self._entry(index)
+        return self._string(offset, length) if length else None
+
+    def answers(self, index):
+        _, _, _, _, first, count = self._entry(index)
+        return [self._answer_at(i).decode("utf-8") for i in range(first, first + count)]
+
+    def is_answer(self, index, text):
+        """Whether text (normalised here) is an accepted answer to the question"""
+        _, _, _, _, lo, count = self._entry(index)
+        key = normalise_answer(text).encode("utf-8")
+        hi = lo + count
+        end = hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._answer_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < end and self._answer_at(lo) == key
+
+    def buckets(self):
+        """
+        {difficulty: question indices} for QuestionScheduler, read from the
+        bucket table without decoding any question
+        """
+        if not self._bucket_count:
+            return {None: range(self.count)}
+        indices_start = self._bucket_table + self._bucket_count * BUCKET.size
+        buckets = {}
+        for i in range(self._bucket_count):
+            offset, length, first, count = BUCKET.unpack_from(self._map, self._bucket_table + i * BUCKET.size)
+            difficulty = self._string(offset, length) if length else None
+            buckets[difficulty] = _IndexView(self._map, indices_start + first * OFFSET.size, count)
+        return buckets
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """database.json-style dict of one question"""
+        question = {"question": self.question(index), "answer": self.answers(index)}
+        difficulty = self.difficulty(index)
+        if difficulty is not None:
+            question["difficulty"] = difficulty
+        return question
+
+    def close(self):
+        self._map.close()
+
+
+class _IndexView:
+    """Read-only sequence of uint32 question indices inside the mapped bank"""
+    def __init__(self, data, start, count):
+        self.data = data
+        self.start = start
+        self.count = count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        return OFFSET.unpack_from(self.data, self.start + position * OFFSET.size)[0]
+
+    def __len__(self):
+        return self.count
+
+
+class QuestionBankRegistry:
+    def __init__(self, directory, source=None, keep=5):
+        """
+        Versioned question banks published through a directory.
+
+        Every version is compiled once into directory/bank-<version>.qbank;
+        the CURRENT file names the published one and is switched with an
+        atomic rename. Workers call refresh() periodically and map a new
+        version only when CURRENT changed.
+
+        Args:
+            directory: where banks and the CURRENT pointer live
+            source: database.json to watch; refresh() compiles it when its
+                content changes (None for workers that only follow CURRENT)
+            keep: compiled versions kept on disk (older ones are deleted;
+                rooms that still map them are not affected)
+        """
+        self.directory = directory
+        self.source = source
+        self.keep = keep
+        self.latest = None
+        self._current_name = None
+        self._source_stat = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _read_current(self):
+        try:
+            with open(os.path.join(self.directory, CURRENT), "r") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _bank_versions(self):
+        versions = []
+        for name in os.listdir(self.directory):
+            if name.startswith("bank-") and name.endswith(".qbank"):
+                versions.append(int(name[5:-6]))
+        return sorted(versions)
+
+    def publish(self, questions, source_hash=b""):
+        """Compile a question list as the next version and make it current; returns the version"""
+        lock_path = os.path.join(self.directory, LOCK)
+        try:
+            if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+        try:
+            lock = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None  # another worker is compiling; its version shows up in CURRENT
+        try:
+            versions = self._bank_versions()
+            version = versions[-1] + 1 if versions else 1
+            name = f"bank-{version:06d}.qbank"
+            compile_bank(questions, os.path.join(self.directory, name), version, source_hash)
+
+            tmp_path = os.path.join(self.directory, CURRENT + ".tmp")
+            with open(tmp_path, "w") as f:
+                f.write(name)
+            os.replace(tmp_path, os.path.join(self.directory, CURRENT))
+
+            for old in versions[:max(0, len(versions) + 1 - self.keep)]:
+                os.remove(os.path.join(self.directory, f"bank-{old:06d}.qbank"))
+        finally:
+            os.close(lock)
+            os.remove(lock_path)
+        return version
+
+    def _check_source(self):
+        """Compile the watched source if it changed since the published version"""
+        try:
+            stat = os.stat(self.source)
+        except FileNotFoundError:
+            return
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key == self._source_stat:
+            return
+
+        with open(self.source, "rb") as f:
+            data = f.read()
+        source_hash = hashlib.sha256(data).digest()
+        if self.latest is None or self.latest.source_hash != source_hash:
+            try:
+                questions = json.loads(data.decode("utf-8"))
+            except ValueError as e:
+                # Keep serving the published bank until the file is fixed
+                print(f"Could not load question bank {self.source}: {e}")
+                self._source_stat = stat_key
+                return
+            try:
+                version = self.publish(questions, source_hash)
+            except Exception as e:
+                # Valid JSON in the wrong shape (missing "answer", not a list...)
+                print(f"Could not compile question bank {self.source}: {e!r}")
+                self._source_stat = stat_key
+                return
+            if version is None:
+                return  # try again on the next refresh
+        self._source_stat = stat_key
+
+    def refresh(self):
+        """Pick up a newer published version; returns True if latest changed"""
+        if self.source and self.latest is None:
+            self._switch()  # compare the source against what is already published
+        if self.source:
+            self._check_source()
+        return self._switch()
+
+    def _switch(self):
+        name = self._read_current()
+        if name is None or name == self._current_name:
+            return False
+        try:
+            bank = CompiledQuestionBank(os.path.join(self.directory, name))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Could not open question bank {name}: {e}")
+            return False
+        # The previous bank is not closed: rooms still using it hold a reference
+        self.latest = bank
+        self._current_name = name
+        return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python server/question_bank.py <database.json> <bank directory>")
+        sys.exit(1)
+    registry = QuestionBankRegistry(sys.argv[2], source=sys.argv[1])
+    registry.refresh()
+    if registry.latest is None:
+        sys.exit(1)
+    print(f"Published version {registry.latest.version} ({len(registry.latest)} questions) in {sys.argv[2]}")
@@ -0,0 +1,128 @@
+import json
+import random
+import zlib
+from utils.question_scheduler import QuestionScheduler
+from server.question_bank import normalise_answer
+
+LAVA_START_QUESTION = 3  # Lava starts rising after this many questions
+
+
+class Room:
+    def __init__(self, room_id, bank, simulation, round_time=30):
+        """
+        One match: players answer the same question and each has their own
+        tower and lava. Spectators only receive snapshots. The numeric state
+        lives in a slot of the shared BatchSimulation.
+
+        bank is the CompiledQuestionBank published when the room was created;
+        the room keeps it even if a newer version is published meanwhile.
+        """
+        self.room_id = room_id
+        self.bank = bank
+        self.simulation = simulation
+        self.round_time = round_time
+        # Built before the slot is reserved, so a bank it rejects leaks nothing
+        self.scheduler = QuestionScheduler(bank.buckets(), seed=self._new_seed())
+
+        self.players = {}      # connection -> player column
+        self.names = {}        # player column -> name
+        self.spectators = set()
+        self.question_number = 0
+        self.question_index = None
+        self.current_question = None
+        self.slot = simulation.add_room(round_time)
+        try:
+            self.next_question()
+        except Exception:
+            simulation.remove_room(self.slot)
+            raise
+
+    def _new_seed(self):
+        """Room id mixed with a random salt: different orders per room and per session"""
+        return zlib.crc32(self.room_id.encode("utf-8")) ^ random.getrandbits(32)
+
+    @property
+    def finished(self):
+        return bool(self.simulation.finished[self.slot])
+
+    def next_question(self):
+        index = self.scheduler.next()
+        if index is None:
+            self.simulation.finished[self.slot] = True
+            return
+        self.question_index = index
+        self.current_question = self.bank.question(index)
+        self.question_number += 1
+        self.simulation.start_question(self.slot, self.round_time, self.question_number > LAVA_START_QUESTION)
+
+    def restart(self):
+        """New round in the same room (new question order, timer and towers)"""
+        self.scheduler.reset(self._new_seed())
+        self.question_number = 0
+        self.simulation.restart_room(self.slot, self.round_time)
+        self.next_question()
+
+    def add_player(self, connection, name):
+        column = self.simulation.add_player(self.slot)
+        if column is None:
+            return False
+        if self.finished:
+            # Kept open by spectators after everyone died or every question was used
+            self.restart()
+        self.players[connection] = column
+        self.names[column] = name
+        return True
+
+    def remove(self, connection):
+        column = self.players.pop(connection, None)
+        if column is not None:
+            self.simulation.remove_player(self.slot, column)
+            del self.names[column]
+        self.spectators.discard(connection)
+
+    def is_empty(self):
+        return not self.players and not self.spectators
+
+    def close(self):
+        """Give the simulation slot back"""
+        self.simulation.remove_room(self.slot)
+
+    def submit_answer(self, connection, answer):
+        """Check a player's answer; returns True if it was correct"""
+        column = self.players.get(connection)
+        if column is None or self.finished or not self.simulation.alive[self.slot, column]:
+            return False
+        if not self.bank.is_answer(self.question_index, answer):
+            return False
+        self.simulation.add_word(self.slot, column, len(normalise_answer(answer)))
+        self.next_question()
+        return True
+
+    def snapshot(self, tick):
+        simulation = self.simulation
+        players = []
+        for column, name in self.names.items():
+            players.append({
+                "name": name,
+                "blocks": int(simulation.total_blocks[self.slot, column]),
+                "lava_y": round(float(simulation.lava_y[self.slot, column]), 1),
+                "alive": bool(simulation.alive[self.slot, column]),
+            })
+        return {
+            "type": "state",
+            "room": self.room_id,
+            "tick": tick,
+            "question": self.current_question,
+            "question_number": self.question_number,
+            "seed": self.scheduler.seed,  # with bank_version, reproduces the question order
+            "bank_version": self.bank.version,
+            "time_remaining": round(float(simulation.time_remaining[self.slot]), 2),
+            "lava_speed": float(simulation.lava_speed[self.slot]) if simulation.rising[self.slot] else 0.0,
+            "finished": self.finished,
+            "players": players,
+            "spectators": len(self.spectators),
+        }
+
+    def encode_snapshot(self, tick):
+        """Serialise the room state once per tick; every receiver gets the same bytes"""
+        return (json.dumps(self.snapshot(tick), separators=(",", ":")) + "\n").encode("utf-8")
@@ -0,0 +1,325 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from server.metrics import ServerMetrics
+from server.room import Room
+from server.batch_sim import BatchSimulation
+from server.question_bank import QuestionBankRegistry
+
+MAX_LINE_BYTES = 16 * 1024  # longest request line; a client that exceeds it is disconnected
+ROLES = ("player", "spectator")
+
+
+class Connection(asyncio.Protocol):
+    def __init__(self, server):
+        """
+        One client socket speaking newline-delimited JSON.
+
+        Outgoing messages are queued during a tick and written with a single
+        transport.write in flush(); the room snapshot is kept apart so a
+        newer one replaces it while the client cannot keep up. While the
+        transport is over write_buffer_limit nothing more is written and
+        reading is paused, so a client that does not read holds at most
+        write_buffer_limit + max_pending_bytes (+ one snapshot) of memory.
+        """
+        self.server = server
+        self.transport = None
+        self.buffer = b""
+        self.room = None
+        self.role = None  # "player" or "spectator"
+
+        self.pending = []          # encoded messages queued this tick
+        self.pending_bytes = 0
+        self.snapshot = None       # latest unsent room snapshot
+        self.writing_paused = False
+        self.reading_paused = False
+        self.dropped_snapshots = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        transport.set_write_buffer_limits(high=self.server.write_buffer_limit)
+        self.server.connections.add(self)
+
+    def connection_lost(self, exc):
+        self.server.connections.discard(self)
+        self.server.unflushed.discard(self)
+        self.server.leave(self)
+
+    def pause_writing(self):
+        # The transport buffer is over write_buffer_limit: stop taking requests
+        # until the client reads; replies stay queued in pending
+        self.writing_paused = True
+        if not self.reading_paused:
+            self.reading_paused = True
+            self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.writing_paused = False
+        if self.pending or self.snapshot is not None:
+            self.server.unflushed.add(self)
+        if self.reading_paused and self.pending_bytes <= self.server.max_pending_bytes:
+            self.reading_paused = False
+            self.transport.resume_reading()
+
+    def data_received(self, data):
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(b"\n")
+        if len(self.buffer) > MAX_LINE_BYTES or any(len(line) > MAX_LINE_BYTES for line in lines):
+            self.transport.close()
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            self.server.metrics.messages_in.inc()
+            try:
+                message = json.loads(line)
+            except ValueError:
+                self.send({"type": "error", "message": "invalid json"})
+                continue
+            if not isinstance(message, dict):
+                self.send({"type": "error", "message": "invalid message"})
+                continue
+            self.server.handle_message(self, message)
+
+    def send(self, message):
+        """Queue one message for this client (written at the end of the tick)"""
+        self.write((json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    def write(self, data):
+        if self.transport is None or self.transport.is_closing():
+            return
+        self.pending.append(data)
+        self.pending_bytes += len(data)
+        self.server.unflushed.add(self)
+        if self.pending_bytes > self.server.max_pending_bytes and not self.reading_paused:
+            # Stop taking requests from a client that does not read its replies
+            self.reading_paused = True
+            self.transport.pause_reading()
+
+    def send_snapshot(self, data):
+        """Queue an encoded room snapshot, replacing one that was not sent yet"""
+        if self.snapshot is not None:
+            self.dropped_snapshots += 1
+            self.server.metrics.dropped_snapshots.inc()
+        self.snapshot = data
+        self.server.unflushed.add(self)
+
+    def buffered_bytes(self):
+        """Bytes waiting in the transport plus bytes queued for the next flush"""
+        in_transport = self.transport.get_write_buffer_size() if self.transport else 0
+        return in_transport + self.pending_bytes + (len(self.snapshot) if self.snapshot else 0)
+
+    def flush(self):
+        """
+        Write everything queued this tick as one framed write
+        Returns: True if data is still waiting (writing is paused)
+        """
+        if self.transport is None or self.transport.is_closing():
+            return False
+        if self.writing_paused:
+            return True
+        if self.snapshot is not None:
+            self.pending.append(self.snapshot)
+            self.snapshot = None
+        if not self.pending:
+            return False
+
+        self.transport.write(b"".join(self.pending))
+        self.server.metrics.messages_out.inc(len(self.pending))
+        self.server.metrics.socket_writes.inc()
+        self.pending = []
+        self.pending_bytes = 0
+        if self.reading_paused and not self.writing_paused:
+            # transport.write() calls pause_writing() itself when it crosses the limit
+            self.reading_paused = False
+            self.transport.resume_reading()
+        return False
+
+
+class GameServer:
+    def __init__(self, config, registry):
+        server_config = config["server"]
+        self.host = server_config["host"]
+        self.port = int(server_config["port"])
+        self.max_players = int(server_config.get("max_players", 4))
+        self.round_time = float(server_config.get("round_time", 30))
+        self.tick_rate = float(server_config.get("tick_rate", 20))
+        self.max_spectators = int(server_config.get("max_spectators", 500))
+        self.write_buffer_limit = int(server_config.get("write_buffer_limit", 65536))
+        self.max_pending_bytes = int(server_config.get("max_pending_bytes", 262144))
+        self.metrics_host = server_config.get("metrics_host", "127.0.0.1")
+        self.metrics_port = int(server_config.get("metrics_port", 9188))
+        self.bank_poll_interval = float(server_config.get("question_bank_poll", 1.0))
+        self.keyframe_ticks = max(1, int(server_config.get("keyframe_ticks", self.tick_rate)))
+
+        self.registry = registry  # new rooms use registry.latest
+        self.rooms = {}  # room id -> Room
+        self.rooms_by_slot = {}  # simulation slot -> Room
+        self.dirty_rooms = set()  # rooms whose state changed since the last broadcast
+        self.simulation = BatchSimulation(max_players=self.max_players)
+        self.tick_count = 0
+        self.connections = set()
+        self.unflushed = set()  # connections with queued data
+        self.metrics = ServerMetrics()
+        self.metrics.players.set_function(lambda: sum(len(room.players) for room in self.rooms.values()))
+        self.metrics.rooms.set_function(lambda: len(self.rooms))
+        self.metrics.outbound_bytes.set_function(
+            lambda: sum(connection.buffered_bytes() for connection in self.connections))
+
+    def handle_message(self, connection, message):
+        kind = message.get("type")
+        if kind == "join":
+            try:
+                self.join(connection, str(message.get("room", "lobby")), message.get("role", "player"),
+                          str(message.get("name", "player")))
+            except Exception as e:
+                # A broken bank must not take the connection (or the room slot) down with it
+                print(f"Could not join room: {e!r}")
+                connection.send({"type": "error", "message": "could not join room"})
+        elif kind == "answer" and connection.room and connection.role == "player":
+            start = time.perf_counter()
+            correct = connection.room.submit_answer(connection, str(message.get("text", "")))
+            self.metrics.answer_check.observe(time.perf_counter() - start)
+            if correct:
+                self.dirty_rooms.add(connection.room)
+            connection.send({"type": "verdict", "text": message.get("text", ""), "correct": correct})
+        else:
+            connection.send({"type": "error", "message": f"unexpected message {kind}"})
+
+    def join(self, connection, room_id, role, name):
+        if role not in ROLES:
+            connection.send({"type": "error", "message": f"unknown role {role}"})
+            return
+        if connection.room:
+            self.leave(connection)
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.rooms[room_id] = Room(room_id, self.registry.latest, self.simulation, self.round_time)
+            self.rooms_by_slot[room.slot] = room
+
+        if role == "spectator":
+            if len(room.spectators) >= self.max_spectators:
+                connection.send({"type": "error", "message": "room has too many spectators"})
+                return
+            room.spectators.add(connection)
+        elif not room.add_player(connection, name):
+            connection.send({"type": "error", "message": "room is full"})
+            return
+
+        connection.room = room
+        connection.role = role
+        self.dirty_rooms.add(room)
+        connection.send({"type": "joined", "room": room_id, "role": role})
+
+    def leave(self, connection):
+        room = connection.room
+        if room is None:
+            return
+        room.remove(connection)
+        connection.room = None
+        if room.is_empty():
+            room.close()
+            del self.rooms[room.room_id]
+            del self.rooms_by_slot[room.slot]
+            self.dirty_rooms.discard(room)
+            self.metrics.room_broadcast.remove(room=room.room_id)
+        else:
+            self.dirty_rooms.add(room)
+
+    def tick(self, dt):
+        """
+        Advance every room in one batch and broadcast snapshots of the rooms
+        that changed. Between changes clients extrapolate the timer and lava
+        from the last snapshot; every room still gets a keyframe once per
+        keyframe_ticks (staggered by slot) so they can resync.
+        """
+        self.tick_count += 1
+        for slot in self.simulation.step(dt):
+            self.dirty_rooms.add(self.rooms_by_slot[slot])
+        for slot in range(self.tick_count % self.keyframe_ticks, self.simulation.capacity, self.keyframe_ticks):
+            room = self.rooms_by_slot.get(slot)
+            if room is not None:
+                self.dirty_rooms.add(room)
+
+        for room in self.dirty_rooms:
+            with self.metrics.room_broadcast.labels(room=room.room_id).time():
+                # Encode once, then only socket writes per receiver
+                snapshot = room.encode_snapshot(self.tick_count)
+                for connection in room.players:
+                    connection.send_snapshot(snapshot)
+                for connection in room.spectators:
+                    connection.send_snapshot(snapshot)
+        self.dirty_rooms.clear()
+
+        # One write per connection that has something queued
+        unflushed, self.unflushed = self.unflushed, set()
+        for connection in unflushed:
+            if connection.flush():
+                self.unflushed.add(connection)
+
+    async def run_ticks(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            start = time.perf_counter()
+            self.tick(interval)
+            self.metrics.tick_duration.observe(time.perf_counter() - start)
+
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def watch_bank(self):
+        """Pick up new question bank versions; compiling runs in a worker thread, off the tick loop"""
+        while True:
+            await asyncio.sleep(self.bank_poll_interval)
+            try:
+                changed = await asyncio.to_thread(self.registry.refresh)
+            except Exception as e:
+                print(f"Question bank refresh failed: {e!r}")
+                continue
+            if changed:
+                print(f"Question bank version {self.registry.latest.version} published; new rooms use it")
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: Connection(self), self.host, self.port)
+        await self.metrics.start(self.metrics_host, self.metrics_port)
+        print(f"Server listening on {self.host}:{self.port} (metrics on {self.metrics_host}:{self.metrics_port})")
+        watcher = asyncio.create_task(self.watch_bank())
+        try:
+            async with server:
+                await self.run_ticks()
+        finally:
+            watcher.cancel()
+
+
+def main():
+    with open("config.json", "r") as f:
+        config = json.load(f)
+    # This process compiles database.json whenever it changes; workers that
+    # only serve rooms would pass source=None and follow the published version
+    registry = QuestionBankRegistry(config["server"].get("question_bank_dir", "banks"), source="database.json")
+    registry.refresh()
+    if registry.latest is None:
+        print("No question bank could be published from database.json")
+        sys.exit(1)
+
+    try:
+        asyncio.run(GameServer(config, registry).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
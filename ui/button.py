@@ -33,6 +33,7 @@ class Button:
         self.scale = 1.0
         self.target_scale = 1.0
         self.scale_speed = 0.05
+        self.animate = True  # False snaps straight to the hover state (low quality)
 
         # Font
         self.font = pygame.font.Font(None, font_size)
@@ -52,6 +53,11 @@ class Button:
             self.target_color = list(self.color)
             self.target_scale = 1.0
 
+        if not self.animate:
+            self.current_color = list(self.target_color)
+            self.scale = self.target_scale
+            return
+
         # Smooth color transition
         for i in range(3):
             if self.current_color[i] < self.target_color[i]:
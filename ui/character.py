@@ -1,22 +1,34 @@
+import os
 import pygame
 from io import BytesIO
+from utils.spritesheet import SpriteSheet, AnimatedSprite
+from utils.atlas import load_image
 
 class Character:
-    def __init__(self, x, y, width=50, height=50, speed=5, image_path=None):
+    def __init__(self, x, y, width=50, height=50, speed=5, image_path=None, get_ticks=None):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.speed = speed
         self.velocity_x = 0
+        self.animation = None
 
         # Load character sprite
         if image_path is None:
             image_path = 'assets/Items/000_0017_star3.png'
         
         try:
-            self.image = pygame.image.load(image_path)
-            self.image = pygame.transform.scale(self.image, (width, height))
+            if os.path.isdir(image_path):
+                # Animated character folder (assets/Fighter...): play its idle strip
+                sheet = SpriteSheet.load(os.path.join(image_path, 'Idle.png'))
+                frame_size = sheet.sheet.get_height()
+                frames = sheet.get_frames(frame_size, frame_size, width / frame_size)
+                self.animation = AnimatedSprite(frames, frame_duration=120, get_ticks=get_ticks)
+                self.image = frames[0]
+            else:
+                self.image = load_image(image_path)
+                self.image = pygame.transform.scale(self.image, (width, height))
             self.use_image = True
         except Exception as e:
             print(f"Could not load character image {image_path}: {e}")
@@ -47,9 +59,20 @@ class Character:
         elif self.x > screen_width - self.width:
             self.x = screen_width - self.width
 
+    def emit(self, render_list, layer=3):
+        """Queue the character into a RenderList"""
+        if self.animation:
+            render_list.blit(self.animation.image, (self.x, self.y), layer)
+        elif self.use_image:
+            render_list.blit(self.image, (self.x, self.y), layer)
+        else:
+            render_list.fill(self.color, (self.x, self.y, self.width, self.height), layer)
+
     def render(self, screen):
         """Draw the character"""
-        if self.use_image:
+        if self.animation:
+            screen.blit(self.animation.image, (self.x, self.y))
+        elif self.use_image:
             screen.blit(self.image, (self.x, self.y))
         else:
             pygame.draw.rect(screen, self.color,
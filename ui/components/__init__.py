@@ -1,4 +1,6 @@
 from .lava import Lava
 from .block_manager import BlockManager
+from .render_list import RenderList
+from .text_input import TextInput
 
-__all__ = ['Lava', 'BlockManager']
+__all__ = ['Lava', 'BlockManager', 'RenderList', 'TextInput']
@@ -1,4 +1,6 @@
 import pygame
+from utils.atlas import load_image
+from .render_list import RenderList
 
 
 class BlockManager:
@@ -10,7 +12,9 @@ class BlockManager:
         self.block_height = block_height
         self.block_spacing = -26
         self.block_base_y = screen_height - 60
+        self.min_top_y = 180  # Minimum Y position for top block
         self.animation_speed = 0.15
+        self.animate = True  # False places new blocks without the slide/fade (low quality)
 
         # List of blocks: [(letter, x, y, animation_progress), ...]
         self.blocks = []
@@ -24,11 +28,15 @@ class BlockManager:
 
         # Font for letters
         self.block_font = None  # Will be set from outside
+        self.letter_cache = {}  # letter -> rendered surface
+
+        # Used when render() is called without a shared RenderList
+        self.render_list = RenderList()
 
     def _load_block_image(self, path, isTop):
         """Load and scale block image"""
         try:
-            image = pygame.image.load(path)
+            image = load_image(path)
             image = pygame.transform.scale(image, (self.block_width if not isTop else self.block_width-20, self.block_height))
             return image
         except Exception as e:
@@ -39,6 +47,7 @@ class BlockManager:
     def set_font(self, font):
         """Set the font for rendering letters"""
         self.block_font = font
+        self.letter_cache = {}
 
     def add_blocks(self, word):
         """Add blocks for a word (reversed so first letter is at bottom)"""
@@ -53,11 +62,9 @@ class BlockManager:
 
     def _remove_bottom_blocks_if_needed(self):
         """Remove blocks from bottom if tower gets too high"""
-        min_y = 180  # Minimum Y position for top block
-
         while self.blocks:
             top_block_y = self._get_top_block_y()
-            if top_block_y < min_y:
+            if top_block_y < self.min_top_y:
                 self.blocks.pop(0)
                 self._recalculate_positions()
             else:
@@ -93,12 +100,23 @@ class BlockManager:
         updated_blocks = []
         for letter, x, y, anim_progress in self.blocks:
             if anim_progress < 1.0:
-                anim_progress = min(1.0, anim_progress + self.animation_speed)
+                anim_progress = min(1.0, anim_progress + self.animation_speed) if self.animate else 1.0
             updated_blocks.append((letter, x, y, anim_progress))
         self.blocks = updated_blocks
 
+    def _get_letter_surface(self, letter):
+        """Render a letter once and reuse it"""
+        if letter not in self.letter_cache:
+            self.letter_cache[letter] = self.block_font.render(letter.upper(), True, (255, 255, 255))
+        return self.letter_cache[letter]
+
     def render(self, screen):
         """Render all blocks"""
+        self.emit(self.render_list)
+        self.render_list.flush(screen)
+
+    def emit(self, render_list, layer=2):
+        """Queue all blocks into a RenderList"""
         if not self.block_font:
             return
 
@@ -113,25 +131,20 @@ class BlockManager:
 
             # Render block image
             if is_top_block and self.block_top_image:
-                block_img = self.block_top_image.copy()
-                block_img.set_alpha(alpha)
-                screen.blit(block_img, (x+10, animated_y))
+                render_list.blit(self.block_top_image, (x+10, animated_y), layer, alpha)
             elif not is_top_block and self.block_bottom_image:
-                block_img = self.block_bottom_image.copy()
-                block_img.set_alpha(alpha)
-                screen.blit(block_img, (x, animated_y))
+                render_list.blit(self.block_bottom_image, (x, animated_y), layer, alpha)
             else:
                 # Fallback: colored rectangle
                 block_rect = pygame.Rect(x, animated_y, self.block_width, self.block_height)
-                pygame.draw.rect(screen, (100, 100, 200), block_rect, border_radius=5)
-                pygame.draw.rect(screen, (255, 255, 255), block_rect, 2, border_radius=5)
+                render_list.rect((100, 100, 200), block_rect, layer, border_radius=5)
+                render_list.rect((255, 255, 255), block_rect, layer, 2, border_radius=5)
 
             # Render letter
-            letter_surface = self.block_font.render(letter.upper(), True, (255, 255, 255))
-            letter_surface.set_alpha(alpha)
+            letter_surface = self._get_letter_surface(letter)
             letter_x = x + (self.block_width - letter_surface.get_width()) // 2
             letter_y = animated_y + (self.block_height - letter_surface.get_height()) // 2+12
-            screen.blit(letter_surface, (letter_x, letter_y))
+            render_list.blit(letter_surface, (letter_x, letter_y), layer, alpha)
 
     def clear(self):
         """Clear all blocks"""
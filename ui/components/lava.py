@@ -1,15 +1,22 @@
+import math
 import pygame
-from PIL import Image
+from .render_list import RenderList
+
+# Stand-in colour for transparent GIF pixels, mapped to the colorkey
+KEY_COLOR = (255, 0, 255)
 
 class Lava:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, get_ticks=None):
         """Initialize lava system"""
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.get_ticks = get_ticks if get_ticks else pygame.time.get_ticks
 
         # Lava properties
         self.lava_y = screen_height  # Start below screen
         self.lava_height = 500
+        self.backdrop_offset = 50  # red fill starts this far below the GIF top
+        self.backdrop_color = (169, 59, 59)
         self.lava_speed = 0  # Will be set to constant speed after start_question
         self.start_question = 3  # Lava starts rising after this many questions
         self.constant_speed = 0.5  # Constant speed (not increasing)
@@ -18,32 +25,30 @@ class Lava:
         self.frames = []
         self.current_frame = 0
         self.frame_delay = 40  # milliseconds between frames
-        self.last_frame_time = pygame.time.get_ticks()
+        self.last_frame_time = self.get_ticks()
 
         try:
-            # Load GIF using PIL
+            # Load GIF using PIL (imported here so it stays off the startup path)
+            from PIL import Image
             gif = Image.open('assets/new_lava.gif')
-            # gif = pygame.transform.scale(gif, (640,480))
-
-            # Extract all frames from GIF
+            rgba_frames = []
             for frame_num in range(gif.n_frames):
                 gif.seek(frame_num)
-                # Convert PIL image to pygame surface
-                frame = gif.convert('RGBA')
-                mode = frame.mode
-                size = frame.size
-                data = frame.tobytes()
-
-                # Create pygame surface
-                pygame_surface = pygame.image.fromstring(data, size, mode)
-                # Scale the frame to 1280x500
-                scaled_surface = pygame.transform.scale(
-                    pygame_surface,
-                    (1280, 500)
-                )
-                self.frames.append(scaled_surface)
-
-            print(f"Loaded {len(self.frames)} frames from GIF")
+                rgba_frames.append(gif.convert('RGBA'))
+
+            # Below the animated waves every frame is one solid colour, so only
+            # the top band is kept as an image and the rest is a plain fill
+            band_rows = self._find_band_rows(rgba_frames)
+            self.backdrop_color = rgba_frames[0].getpixel((0, gif.height - 1))[:3]
+            band_height = math.ceil(band_rows * self.lava_height / gif.height)
+
+            for frame in rgba_frames:
+                band = frame.crop((0, 0, gif.width, band_rows))
+                band = band.resize((self.screen_width, band_height), Image.NEAREST)
+                self.frames.append(self._to_palette_surface(band))
+
+            frame_bytes = sum(f.get_width() * f.get_height() * f.get_bytesize() for f in self.frames)
+            print(f"Loaded {len(self.frames)} frames from GIF ({frame_bytes // 1024} KB)")
 
         except Exception as e:
             # Fallback to colored rectangle if image not found
@@ -54,6 +59,37 @@ class Lava:
         self.lava_color = (255, 50, 0)  # Bright red-orange
         self.lava_top_color = (200, 0, 0)  # Dark red
 
+        # Used when render() is called without a shared RenderList
+        self.render_list = RenderList()
+
+    def _find_band_rows(self, frames):
+        """Number of source rows above the part that is solid in every frame"""
+        band_rows = 1
+        for frame in frames:
+            width, height = frame.size
+            pixels = frame.load()
+            for y in range(height - 1, -1, -1):
+                first = pixels[0, y]
+                if any(pixels[x, y] != first for x in range(1, width)):
+                    band_rows = max(band_rows, y + 1)
+                    break
+        return band_rows
+
+    def _to_palette_surface(self, image):
+        """Convert an RGBA PIL image with on/off alpha into an 8-bit RLE colorkeyed surface"""
+        from PIL import Image
+        keyed = Image.new('RGB', image.size, KEY_COLOR)
+        keyed.paste(image, mask=image.getchannel('A'))
+        paletted = keyed.convert('P', palette=Image.Palette.ADAPTIVE, colors=256)
+
+        palette = paletted.getpalette()[:768]
+        colors = [tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)]
+        surface = pygame.image.fromstring(paletted.tobytes(), image.size, 'P')
+        surface.set_palette(colors)
+        if KEY_COLOR in colors:
+            surface.set_colorkey(colors.index(KEY_COLOR), pygame.RLEACCEL)
+        return surface
+
     def start_rising(self):
         """Start lava rising at constant speed"""
         if self.lava_speed == 0:
@@ -70,7 +106,7 @@ class Lava:
 
         # Update animation frame
         if len(self.frames) > 0:
-            current_time = pygame.time.get_ticks()
+            current_time = self.get_ticks()
             if current_time - self.last_frame_time > self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.frames)
                 self.last_frame_time = current_time
@@ -82,28 +118,37 @@ class Lava:
 
     def render(self, screen):
         """Render the lava"""
+        self.emit(self.render_list)
+        self.render_list.flush(screen)
+
+    def emit(self, render_list, layer=4):
+        """Queue the lava into a RenderList"""
         if self.lava_y < self.screen_height:
             if len(self.frames) > 0:
-                # Draw red background first
-                red_background = pygame.Rect(0, self.lava_y+50, self.screen_width,
+                visible_height = int(self.screen_height - self.lava_y) + 1
+
+                # Draw red background first (solid part of the lava)
+                red_background = pygame.Rect(0, self.lava_y+self.backdrop_offset, self.screen_width,
                                             self.screen_height - self.lava_y)
-                pygame.draw.rect(screen, (169, 59, 59), red_background)
+                render_list.fill(self.backdrop_color, red_background, layer)
 
-                # Draw GIF frame once at the lava position
-                screen.blit(self.frames[self.current_frame], (0, self.lava_y))
+                # Draw only the on-screen rows of the animated band
+                frame = self.frames[self.current_frame]
+                render_list.blit(frame, (0, self.lava_y), layer,
+                                 area=(0, 0, frame.get_width(), min(frame.get_height(), visible_height)))
             else:
                 # Fallback: Draw main lava body
                 lava_rect = pygame.Rect(0, self.lava_y, self.screen_width,
                                     self.screen_height - self.lava_y)
-                pygame.draw.rect(screen, self.lava_color, lava_rect)
+                render_list.fill(self.lava_color, lava_rect, layer)
 
                 # Add darker red on top for effect
                 top_lava = pygame.Rect(0, self.lava_y, self.screen_width, 20)
-                pygame.draw.rect(screen, self.lava_top_color, top_lava)
+                render_list.fill(self.lava_top_color, top_lava, layer)
 
     def reset(self):
         """Reset lava to initial state"""
         self.lava_y = self.screen_height
         self.lava_speed = 0
         self.current_frame = 0
-        self.last_frame_time = pygame.time.get_ticks()
+        self.last_frame_time = self.get_ticks()
@@ -0,0 +1,117 @@
+import time
+import pygame
+
+# Transparent stand-in for rounded panel corners
+PANEL_KEY = (255, 0, 255)
+
+
+class RenderList:
+    def __init__(self, alpha_steps=16, max_panels=64):
+        """
+        Per-frame buffer of draw commands submitted with one Surface.blits call.
+
+        Components add blits (and solid/rounded rects, which are turned into
+        blits of cached surfaces) with a layer; flush() sorts by layer, culls
+        anything off-target and draws everything at once.
+
+        Args:
+            alpha_steps: number of cached alpha levels per faded surface
+            max_panels: cached rect panels kept before the oldest is dropped
+        """
+        self.commands = []  # [(layer, source, dest, area), ...]
+        self.alpha_steps = alpha_steps
+        self.max_panels = max_panels
+
+        # Cached surfaces reused across frames
+        self.alpha_cache = {}   # (surface, level) -> faded copy
+        self.panel_cache = {}   # (size, color, width, radius) -> panel surface
+        self.solid_cache = {}   # color -> solid surface blitted with an area
+
+        # Stats of the last flush (for profiling)
+        self.last_count = 0
+        self.last_culled = 0
+        self.last_flush_time = 0.0
+
+    def blit(self, surface, pos, layer=0, alpha=None, area=None):
+        """Queue a blit; alpha (0-255) uses a cached faded copy of surface"""
+        if alpha is not None and alpha < 255:
+            if alpha <= 0:
+                return
+            surface = self._faded(surface, alpha)
+        self.commands.append((layer, surface, pos, area))
+
+    def rect(self, color, rect, layer=0, width=0, border_radius=0):
+        """Queue pygame.draw.rect-style output as a blit of a cached panel"""
+        rect = pygame.Rect(rect)
+        if width == 0 and border_radius == 0:
+            self.fill(color, rect, layer)
+            return
+
+        key = (rect.size, tuple(color[:3]), width, border_radius)
+        panel = self.panel_cache.get(key)
+        if panel is None:
+            panel = pygame.Surface(rect.size)
+            panel.fill(PANEL_KEY)
+            pygame.draw.rect(panel, color[:3], panel.get_rect(), width, border_radius=border_radius)
+            panel.set_colorkey(PANEL_KEY, pygame.RLEACCEL)
+            if len(self.panel_cache) >= self.max_panels:
+                del self.panel_cache[next(iter(self.panel_cache))]
+            self.panel_cache[key] = panel
+        self.commands.append((layer, panel, rect.topleft, None))
+
+    def fill(self, color, rect, layer=0):
+        """Queue a solid rectangle (blitted from a cached solid surface)"""
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        color = tuple(color[:3])
+        solid = self.solid_cache.get(color)
+        if solid is None or solid.get_width() < rect.width or solid.get_height() < rect.height:
+            size = (max(rect.width, solid.get_width() if solid else 0),
+                    max(rect.height, solid.get_height() if solid else 0))
+            solid = pygame.Surface(size)
+            solid.fill(color)
+            self.solid_cache[color] = solid
+        self.commands.append((layer, solid, rect.topleft, (0, 0, rect.width, rect.height)))
+
+    def _faded(self, surface, alpha):
+        """Return a copy of surface at the nearest cached alpha level"""
+        level = max(1, round(alpha * self.alpha_steps / 255))
+        key = (surface, level)
+        faded = self.alpha_cache.get(key)
+        if faded is None:
+            faded = surface.copy()
+            faded.set_alpha(level * 255 // self.alpha_steps)
+            self.alpha_cache[key] = faded
+        return faded
+
+    def flush(self, target):
+        """Draw all queued commands onto target in layer order and clear the list"""
+        start = time.perf_counter()
+        target_rect = target.get_rect()
+
+        self.commands.sort(key=lambda command: command[0])
+        batch = []
+        culled = 0
+        for _, source, pos, area in self.commands:
+            if area is None:
+                width, height = source.get_size()
+            else:
+                width, height = area[2], area[3]
+            if not target_rect.colliderect((pos[0], pos[1], width, height)):
+                culled += 1
+                continue
+            batch.append((source, pos) if area is None else (source, pos, area))
+
+        target.blits(batch, doreturn=False)
+
+        self.last_count = len(batch)
+        self.last_culled = culled
+        self.last_flush_time = time.perf_counter() - start
+        self.commands = []
+
+    def clear_cache(self):
+        """Forget cached panels and faded copies (e.g. when leaving a screen)"""
+        self.alpha_cache = {}
+        self.panel_cache = {}
+        self.solid_cache = {}
@@ -0,0 +1,69 @@
+import pygame
+
+
+class TextInput:
+    def __init__(self, max_length=64):
+        """
+        Editable single-line buffer fed by SDL text-input events.
+
+        Characters come from TEXTINPUT (already composed by the keyboard
+        layout/IME, so shifted and non-Latin characters work); KEYDOWN is only
+        used for editing keys.
+
+        Args:
+            max_length: characters accepted before further input is ignored
+        """
+        self.max_length = max_length
+        self.text = ""
+        self.cursor = 0
+
+    def insert(self, text):
+        text = text[:self.max_length - len(self.text)]
+        if not text:
+            return False
+        self.text = self.text[:self.cursor] + text + self.text[self.cursor:]
+        self.cursor += len(text)
+        return True
+
+    def backspace(self):
+        if self.cursor == 0:
+            return False
+        self.text = self.text[:self.cursor - 1] + self.text[self.cursor:]
+        self.cursor -= 1
+        return True
+
+    def delete(self):
+        if self.cursor >= len(self.text):
+            return False
+        self.text = self.text[:self.cursor] + self.text[self.cursor + 1:]
+        return True
+
+    def move(self, position):
+        position = max(0, min(len(self.text), position))
+        moved = position != self.cursor
+        self.cursor = position
+        return moved
+
+    def clear(self):
+        self.text = ""
+        self.cursor = 0
+
+    def handle_event(self, event):
+        """Apply a TEXTINPUT or editing KEYDOWN; returns True if the buffer or cursor changed"""
+        if event.type == pygame.TEXTINPUT:
+            return self.insert(event.text)
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_BACKSPACE:
+            return self.backspace()
+        if event.key == pygame.K_DELETE:
+            return self.delete()
+        if event.key == pygame.K_LEFT:
+            return self.move(self.cursor - 1)
+        if event.key == pygame.K_RIGHT:
+            return self.move(self.cursor + 1)
+        if event.key == pygame.K_HOME:
+            return self.move(0)
+        if event.key == pygame.K_END:
+            return self.move(len(self.text))
+        return False
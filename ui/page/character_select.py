@@ -1,5 +1,7 @@
 import pygame
 import os
+from utils.atlas import load_image
+from ui.components import RenderList
 
 
 class CharacterSelectScreen:
@@ -31,6 +33,15 @@ class CharacterSelectScreen:
         self.selected_color = (100, 150, 255)
         self.text_color = (255, 255, 255)
 
+        # Static text is rendered once
+        self.title_text = self.title_font.render("SELECT YOUR CHARACTER", True, self.text_color)
+        self.instruction_text = self.font.render("Use ARROW KEYS or CLICK to select, ENTER to confirm", True, self.text_color)
+        for character in self.characters:
+            character["name_text"] = self.font.render(character["name"], True, self.text_color)
+
+        # Draw commands of a frame, submitted with one Surface.blits call
+        self.render_list = RenderList()
+
     def _load_background(self):
         """Load background image"""
         try:
@@ -57,7 +68,7 @@ class CharacterSelectScreen:
 
         for char in character_data:
             try:
-                image = pygame.image.load(char["path"])
+                image = load_image(char["path"])
                 # Scale to fit card
                 image = pygame.transform.scale(image, (150, 150))
                 characters.append({
@@ -83,6 +94,12 @@ class CharacterSelectScreen:
         total_width = len(self.characters) * self.card_width + (len(self.characters) - 1) * self.card_spacing
         return (self.screen_width - total_width) // 2
 
+    def enter(self):
+        """Called when the screen is shown"""
+
+    def exit(self):
+        """Called when the screen is left"""
+
     def handle_event(self, event):
         """Handle input events"""
         if event.type == pygame.QUIT:
@@ -116,13 +133,12 @@ class CharacterSelectScreen:
     def render(self):
         """Render character selection screen"""
         # Draw background
-        self.screen.blit(self.background, (0, 0))
+        self.render_list.blit(self.background, (0, 0))
 
         # Draw title
-        title_text = self.title_font.render("SELECT YOUR CHARACTER", True, self.text_color)
-        title_x = self.screen_width // 2 - title_text.get_width() // 2
+        title_x = self.screen_width // 2 - self.title_text.get_width() // 2
         title_y = 80
-        self.screen.blit(title_text, (title_x, title_y))
+        self.render_list.blit(self.title_text, (title_x, title_y))
 
         # Draw character cards
         for i, character in enumerate(self.characters):
@@ -135,25 +151,26 @@ class CharacterSelectScreen:
 
             # Draw card background
             card_rect = pygame.Rect(card_x, card_y, self.card_width, self.card_height)
-            pygame.draw.rect(self.screen, color, card_rect, border_radius=15)
+            self.render_list.rect(color, card_rect, border_radius=15)
 
             # Draw border for selected card
             if is_selected:
-                pygame.draw.rect(self.screen, (255, 255, 255), card_rect, 4, border_radius=15)
+                self.render_list.rect((255, 255, 255), card_rect, width=4, border_radius=15)
 
             # Draw character image
             image_x = card_x + (self.card_width - character["image"].get_width()) // 2
             image_y = card_y + 20
-            self.screen.blit(character["image"], (image_x, image_y))
+            self.render_list.blit(character["image"], (image_x, image_y))
 
             # Draw character name
-            name_text = self.font.render(character["name"], True, self.text_color)
+            name_text = character["name_text"]
             name_x = card_x + (self.card_width - name_text.get_width()) // 2
             name_y = card_y + self.card_height - 50
-            self.screen.blit(name_text, (name_x, name_y))
+            self.render_list.blit(name_text, (name_x, name_y))
 
         # Draw instructions
-        instruction_text = self.font.render("Use ARROW KEYS or CLICK to select, ENTER to confirm", True, self.text_color)
-        instruction_x = self.screen_width // 2 - instruction_text.get_width() // 2
+        instruction_x = self.screen_width // 2 - self.instruction_text.get_width() // 2
         instruction_y = self.screen_height - 100
-        self.screen.blit(instruction_text, (instruction_x, instruction_y))
+        self.render_list.blit(self.instruction_text, (instruction_x, instruction_y))
+
+        self.render_list.flush(self.screen)
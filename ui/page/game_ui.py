@@ -1,17 +1,47 @@
+import random
 import pygame
 from ui.character import Character
 from ui.button import Button
-from ui.components import Lava, BlockManager
+from ui.components import Lava, BlockManager, RenderList, TextInput
+from utils.checkAns import CheckAns
+from utils.validator import AnswerValidator
+from utils.question_scheduler import QuestionScheduler
+from utils.telemetry import OUTCOME_CORRECT, OUTCOME_TIME_UP, OUTCOME_LAVA
+from utils.input_latency import KeystrokeLatency
 import json
 
 
 class GameScreen:
-    def __init__(self, screen, word_checker, config, font, character_image_path=None):
+    def __init__(self, screen, word_checker, config, font, character_image_path=None, validator=None,
+                 get_ticks=None, recorder=None, score_store=None, telemetry=None):
         """Initialize the game screen component"""
         self.screen = screen
         self.word_checker = word_checker
         self.character_image_path = character_image_path
 
+        # Time and mouse sources (replaced by the replay driver)
+        self.get_ticks = get_ticks if get_ticks else pygame.time.get_ticks
+        self.get_mouse_pos = pygame.mouse.get_pos
+
+        # Optional InputRecorder (utils/replay.py)
+        self.recorder = recorder
+
+        # Optional ScoreStore (utils/score_store.py) for finished games
+        self.score_store = score_store
+        self.answer_log = []  # (question, answer, seconds) of correct answers
+        self.result_recorded = False
+        self.best_score = 0
+
+        # Optional AnswerTelemetry (utils/telemetry.py): one record per question
+        self.telemetry = telemetry
+        self.current_question_id = None
+        self.first_key_time = None
+        self.wrong_attempts = 0
+
+        # Answers are checked off the main thread and applied in update()
+        self.validator = validator if validator else AnswerValidator()
+        self.pending_answer = None
+
         # Get screen dimensions from config
         self.screen_width = int(config["client"]["screen_width"])
         self.screen_height = int(config["client"]["screen_height"])
@@ -23,12 +53,17 @@ class GameScreen:
 
         # Load background
         self.background = self._load_background()
+        self.background_color = pygame.transform.average_color(self.background)[:3]
+        self.background_detail = True  # False draws the background's average colour (low quality)
+
+        # Draw commands of a frame, submitted with one Surface.blits call
+        self.render_list = RenderList()
 
         # Initialize components
         self.block_manager = BlockManager(self.screen_width, self.screen_height)
         self.block_manager.set_font(self.block_font)
 
-        self.lava = Lava(self.screen_width, self.screen_height)
+        self.lava = Lava(self.screen_width, self.screen_height, self.get_ticks)
 
         # Load questions database
         with open('database.json', "r", encoding='utf-8') as f:
@@ -37,16 +72,26 @@ class GameScreen:
         # Timer (30 seconds per question)
         self.time_limit = 30
         self.time_remaining = self.time_limit
-        self.timer_start = pygame.time.get_ticks()
-
-        # Question system
+        self.timer_start = self.get_ticks()
+
+        # Question system (questions are drawn in a seeded random order)
+        game_config = config.get("game", {})
+        self.scheduler = QuestionScheduler.from_questions(
+            self.questions_data,
+            weights=game_config.get("difficulty_weights"),
+            shuffle=game_config.get("shuffle_questions", True)
+        )
+        self.session_seed = self.scheduler.seed
+        self.games_played = 0
         self.current_question = None
         self.current_answers = []
-        self.question_index = 0
+        self.question_index = 0  # Number of questions asked so far
         self.load_next_question()
 
         # Game state
-        self.current_input = ""
+        self.text_input = TextInput()
+        self.input_latency = KeystrokeLatency()  # main loop calls presented() after each flip
+        self.text_input_rect = None
         self.game_over = False
         self.game_won = False
         self.game_message = ""
@@ -55,7 +100,8 @@ class GameScreen:
         self.feedback_color = (255, 255, 255)
 
         # Create player character with selected image (larger size)
-        self.player1 = Character(0, 0, width=120, height=120, image_path=self.character_image_path)
+        self.characters = {}  # image path -> Character, reused across sessions
+        self.player1 = self._get_character(self.character_image_path)
 
         # Create menu button
         button_width = 120
@@ -73,6 +119,39 @@ class GameScreen:
         # Set up key repeat
         pygame.key.set_repeat(500, 50)
 
+    def _get_character(self, image_path):
+        """Create a character sprite once per image path"""
+        if image_path not in self.characters:
+            self.characters[image_path] = Character(0, 0, width=120, height=120, image_path=image_path,
+                                                    get_ticks=self.get_ticks)
+        return self.characters[image_path]
+
+    def enter(self, character_image_path=None, recorder=None, seed=None):
+        """Start a new session on this screen, only swapping the character sprite"""
+        self.character_image_path = character_image_path
+        self.player1 = self._get_character(character_image_path)
+        self.recorder = recorder
+        self.session_seed = seed if seed is not None else random.getrandbits(32)
+        self.games_played = 0
+        self.input_latency.reset()
+        pygame.key.start_text_input()
+        self.restart_game()
+
+    def exit(self):
+        """Leave the screen; assets stay loaded for the next enter()"""
+        self.validator.cancel()
+        self.pending_answer = None
+        self.recorder = None
+        pygame.key.stop_text_input()
+        self.input_latency.report()
+
+    def set_quality(self, preset):
+        """Apply a quality preset from utils.frame_governor.QUALITY_PRESETS"""
+        self.lava.frame_delay = preset["lava_frame_delay"]
+        self.block_manager.animate = preset["animations"]
+        self.menu_button.animate = preset["animations"]
+        self.background_detail = preset["background_detail"]
+
     def _load_background(self):
         """Load and scale background image"""
         try:
@@ -87,23 +166,41 @@ class GameScreen:
 
     def load_next_question(self):
         """Load the next question from database"""
-        if self.question_index < len(self.questions_data):
-            question_data = self.questions_data[self.question_index]
+        next_index = self.scheduler.next()
+        if next_index is not None:
+            question_data = self.questions_data[next_index]
+            self.current_question_id = next_index
+            self.first_key_time = None
+            self.wrong_attempts = 0
             self.current_question = question_data["question"]
             self.current_answers = [ans.lower() for ans in question_data["answer"]]
             self.question_index += 1
             self.time_remaining = self.time_limit
-            self.timer_start = pygame.time.get_ticks()
+            self.timer_start = self.get_ticks()
         else:
             # All questions answered - WIN!
             self.game_won = True
             self.game_over = True
             self.game_message = "YOU WIN! All questions completed!"
 
+    def submit_answer(self, answer):
+        """Send an answer to the validator; the verdict is applied in update()"""
+        answer = answer.lower().strip()
+        self.pending_answer = answer
+        self.text_input.clear()
+        self.validator.submit(answer, self.current_answers, tag=self.question_index)
+
     def check_answer(self, answer):
-        """Check if the answer is correct"""
+        """Check if the answer is correct (synchronously)"""
         answer = answer.lower().strip()
-        if answer in self.current_answers:
+        return self.apply_answer(answer, CheckAns(answer, self.current_answers).result())
+
+    def apply_answer(self, answer, is_correct):
+        """Apply the verdict for an answer"""
+        if is_correct:
+            self.answer_log.append((self.current_question, answer, (self.get_ticks() - self.timer_start) / 1000))
+            self._emit_telemetry(OUTCOME_CORRECT)
+
             # Calculate lava decrease based on answer length
             num_blocks = len(answer)
             lava_decrease = num_blocks * (self.block_manager.block_height + self.block_manager.block_spacing)
@@ -113,10 +210,10 @@ class GameScreen:
             self.block_manager.add_blocks(answer)
 
             # Update feedback
-            self.current_input = ""
+            self.text_input.clear()
             self.feedback_message = f"Correct! '{answer}'"
             self.feedback_color = (0, 255, 0)
-            self.feedback_timer = pygame.time.get_ticks()
+            self.feedback_timer = self.get_ticks()
 
             # Start lava rising after certain questions (constant speed)
             if self.question_index >= self.lava.start_question:
@@ -126,16 +223,17 @@ class GameScreen:
             return True
         else:
             # Wrong answer
+            self.wrong_attempts += 1
             self.feedback_message = "Wrong answer! Try again"
             self.feedback_color = (255, 100, 100)
-            self.feedback_timer = pygame.time.get_ticks()
-            self.current_input = ""
+            self.feedback_timer = self.get_ticks()
+            self.text_input.clear()
             return False
 
     def update_timer(self):
         """Update the countdown timer"""
         if not self.game_over:
-            elapsed = (pygame.time.get_ticks() - self.timer_start) / 1000
+            elapsed = (self.get_ticks() - self.timer_start) / 1000
             self.time_remaining = max(0, self.time_limit - elapsed)
 
             if self.time_remaining <= 0:
@@ -147,6 +245,9 @@ class GameScreen:
         if event.type == pygame.QUIT:
             return False
 
+        if self.recorder:
+            self.recorder.record_event(event, self.get_ticks())
+
         # Check if menu button was clicked
         if self.menu_button.is_clicked(event):
             return "menu"
@@ -157,39 +258,52 @@ class GameScreen:
                 self.restart_game()
             return True
 
-        # Handle keyboard input
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE:
-                self.current_input = self.current_input[:-1]
-            elif event.key == pygame.K_RETURN:
-                if self.current_input:
-                    self.check_answer(self.current_input)
-            elif event.key == pygame.K_SPACE:
-                self.current_input += " "
-            else:
-                key_name = pygame.key.name(event.key)
-                if len(key_name) == 1:
-                    self.current_input += key_name
+        # Handle keyboard input (characters arrive as TEXTINPUT, editing keys as KEYDOWN)
+        if event.type in (pygame.TEXTINPUT, pygame.KEYDOWN):
+            if self.first_key_time is None:
+                self.first_key_time = self.get_ticks()
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                if self.text_input.text and self.pending_answer is None:
+                    self.submit_answer(self.text_input.text)
+                    self.input_latency.keystroke()
+            elif self.text_input.handle_event(event):
+                self.input_latency.keystroke()
 
         return True
 
     def restart_game(self):
         """Restart the game"""
-        self.current_input = ""
+        self.text_input.clear()
+        self.validator.cancel()
+        self.pending_answer = None
         self.block_manager.clear()
         self.question_index = 0
+        # Every restart gets its own order, derived from the session seed
+        self.scheduler.reset((self.session_seed + self.games_played) & 0xFFFFFFFF)
+        self.games_played += 1
         self.game_over = False
         self.game_won = False
         self.game_message = ""
+        self.feedback_message = ""
+        self.answer_log = []
+        self.result_recorded = False
         self.lava.reset()
         self.load_next_question()
 
     def update(self):
         """Update game state"""
         # Update button
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.get_mouse_pos()
+        if self.recorder:
+            self.recorder.record_tick(self.get_ticks(), mouse_pos)
         self.menu_button.update(mouse_pos)
 
+        # Apply verdicts from the validator (stale ones belong to an old question)
+        for answer, tag, is_correct in self.validator.poll():
+            self.pending_answer = None
+            if not self.game_over and tag == self.question_index:
+                self.apply_answer(answer, is_correct)
+
         # Update timer
         self.update_timer()
 
@@ -201,6 +315,9 @@ class GameScreen:
             self.game_over = True
             self.game_message = "LAVA GOT YOU! You died!"
 
+        if self.game_over and not self.result_recorded:
+            self._record_result()
+
         # Update blocks
         self.block_manager.update()
 
@@ -212,19 +329,48 @@ class GameScreen:
         self.player1.y = char_y-60
 
         # Clear feedback after 2 seconds
-        if self.feedback_message and pygame.time.get_ticks() - self.feedback_timer > 2000:
+        if self.feedback_message and self.get_ticks() - self.feedback_timer > 2000:
             self.feedback_message = ""
 
+    def _emit_telemetry(self, outcome):
+        """Write the timing record of the current question"""
+        if not self.telemetry or self.current_question_id is None:
+            return
+        now = self.get_ticks()
+        first_key_ms = None if self.first_key_time is None else self.first_key_time - self.timer_start
+        answer_ms = now - self.timer_start if outcome == OUTCOME_CORRECT else None
+        lava_distance = self.lava.lava_y - (self.player1.y + self.player1.height)
+        self.telemetry.record(self.current_question_id, first_key_ms, answer_ms,
+                              self.wrong_attempts, lava_distance, outcome)
+
+    def _record_result(self):
+        """Hand the finished game to the score store (written in the background)"""
+        self.result_recorded = True
+        if not self.game_won:
+            # The question that was on screen when the player died
+            self._emit_telemetry(OUTCOME_TIME_UP if self.time_remaining <= 0 else OUTCOME_LAVA)
+        score = self.block_manager.get_total_blocks_created()
+        if self.score_store:
+            self.score_store.record_game(self.character_image_path, score, self.game_won, self.answer_log)
+            self.best_score = self.score_store.best_score()
+        else:
+            self.best_score = max(self.best_score, score)
+
     def render(self):
         """Render all UI elements"""
         # Draw background
-        self.screen.blit(self.background, (0, 0))
+        if self.background_detail:
+            self.render_list.blit(self.background, (0, 0), layer=0)
+        else:
+            self.render_list.fill(self.background_color, self.screen.get_rect(), layer=0)
 
         if self.game_over:
             self._render_game_over()
         else:
             self._render_game()
 
+        self.render_list.flush(self.screen)
+
         # Render menu button (always on top)
         self.menu_button.draw(self.screen)
 
@@ -235,17 +381,17 @@ class GameScreen:
         game_over_text = self.font.render(self.game_message, True, message_color)
         text_x = self.screen_width // 2 - game_over_text.get_width() // 2
         text_y = self.screen_height // 2 - 50
-        self.screen.blit(game_over_text, (text_x, text_y))
+        self.render_list.blit(game_over_text, (text_x, text_y), layer=1)
 
-        point_text = self.small_font.render(f'Point: {self.block_manager.get_total_blocks_created()}', True, (255,255,255))
+        point_text = self.small_font.render(f'Point: {self.block_manager.get_total_blocks_created()}   Best: {self.best_score}', True, (255,255,255))
         text_x = self.screen_width // 2 - point_text.get_width() // 2
         text_y = self.screen_height // 2 + 30
-        self.screen.blit(point_text, (text_x, text_y))
+        self.render_list.blit(point_text, (text_x, text_y), layer=1)
 
         restart_text = self.small_font.render("Press ENTER to restart", True, (255, 255, 255))
         restart_x = self.screen_width // 2 - restart_text.get_width() // 2
         restart_y = self.screen_height // 2 + 100
-        self.screen.blit(restart_text, (restart_x, restart_y))
+        self.render_list.blit(restart_text, (restart_x, restart_y), layer=1)
 
     def _render_game(self):
         """Render active game"""
@@ -261,20 +407,20 @@ class GameScreen:
                 question_text.get_width() + padding * 2,
                 question_text.get_height() + padding * 2
             )
-            pygame.draw.rect(self.screen, (0, 0, 0, 128), question_bg, border_radius=10)
-            self.screen.blit(question_text, (question_x, question_y))
+            self.render_list.rect((0, 0, 0, 128), question_bg, layer=1, border_radius=10)
+            self.render_list.blit(question_text, (question_x, question_y), layer=1)
 
         # Render timer
         timer_color = (255, 255, 255) if self.time_remaining > 10 else (255, 0, 0)
         timer_text = self.small_font.render(f"Time: {int(self.time_remaining)}s", True, timer_color)
-        self.screen.blit(timer_text, (20, 20))
+        self.render_list.blit(timer_text, (20, 20), layer=1)
 
         # Render progress
         progress_text = self.small_font.render(
             f"Question: {self.question_index}/{len(self.questions_data)}",
             True, (255, 255, 255)
         )
-        self.screen.blit(progress_text, (20, 60))
+        self.render_list.blit(progress_text, (20, 60), layer=1)
 
         # Render input box
         self._render_input_box()
@@ -292,26 +438,36 @@ class GameScreen:
 
             # Draw background
             feedback_bg = pygame.Rect(feedback_x, feedback_y, feedback_width, feedback_height)
-            pygame.draw.rect(self.screen, (50, 50, 50, 200), feedback_bg, border_radius=10)
+            self.render_list.rect((50, 50, 50, 200), feedback_bg, layer=1, border_radius=10)
 
             # Draw text
             text_x = feedback_x + padding
             text_y = feedback_y + padding
-            self.screen.blit(feedback_text, (text_x, text_y))
+            self.render_list.blit(feedback_text, (text_x, text_y), layer=1)
 
         # Render blocks
-        self.block_manager.render(self.screen)
+        self.block_manager.emit(self.render_list, layer=2)
 
         # Render character
-        self.player1.render(self.screen)
+        self.player1.emit(self.render_list, layer=3)
 
         # Render lava
-        self.lava.render(self.screen)
+        self.lava.emit(self.render_list, layer=4)
 
     def _render_input_box(self):
         """Render the input box on the right side"""
-        input_display = self.current_input + "_"
-        input_text = self.font.render(input_display, True, (255, 255, 255))
+        if self.pending_answer is not None:
+            # Waiting for the validator
+            input_text = self.font.render(self.pending_answer + "...", True, (160, 160, 160))
+        else:
+            text, cursor = self.text_input.text, self.text_input.cursor
+            if cursor == len(text):
+                input_text = self.font.render(text + "_", True, (255, 255, 255))
+            else:
+                # Caret inside the text: draw it as a bar between characters
+                input_text = self.font.render(text, True, (255, 255, 255))
+                caret_x = self.font.size(text[:cursor])[0]
+                pygame.draw.rect(input_text, (255, 255, 255), (caret_x, 0, 2, input_text.get_height()))
 
         padding = 15
         input_width = max(input_text.get_width(), 300) + padding * 2
@@ -319,8 +475,12 @@ class GameScreen:
         input_y = 150
 
         input_bg = pygame.Rect(input_x, input_y, input_width, input_text.get_height() + padding * 2)
-        pygame.draw.rect(self.screen, (50, 50, 50, 200), input_bg, border_radius=10)
+        self.render_list.rect((50, 50, 50, 200), input_bg, layer=1, border_radius=10)
 
         text_x = input_x + (input_width - input_text.get_width()) // 2
         text_y = input_y + padding
-        self.screen.blit(input_text, (text_x, text_y))
+        self.render_list.blit(input_text, (text_x, text_y), layer=1)
+        if input_bg != self.text_input_rect:
+            # Keeps IME candidate windows next to the box
+            self.text_input_rect = input_bg
+            pygame.key.set_text_input_rect(input_bg)
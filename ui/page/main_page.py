@@ -20,6 +20,13 @@ class MainPage:
                 background = pygame.Surface((self.screenWidth, self.screenHeight))
                 background.fill((20, 100, 150))  # Sea blue color
                 return background
+
+    def enter(self):
+        """Called when the page is shown"""
+
+    def exit(self):
+        """Called when the page is left"""
+
     def render(self):
         self.screen.blit(self.background, (0, 0))
 
@@ -55,6 +55,14 @@ class SplashScreen:
 
         return True
 
+    def draw(self, alpha, fade_surface=None):
+        """Draw one splash frame with the logo at the given alpha"""
+        if fade_surface is None:
+            fade_surface = self.logo
+        self.screen.fill((0, 0, 0))  # Black background
+        fade_surface.set_alpha(alpha)
+        self.screen.blit(fade_surface, self.logo_rect)
+
     def _fade_in(self, fade_surface, clock):
         """Fade in animation"""
         for alpha in range(0, 256, self.fade_speed):
@@ -67,9 +75,7 @@ class SplashScreen:
                     return True
 
             # Render
-            self.screen.fill((0, 0, 0))  # Black background
-            fade_surface.set_alpha(alpha)
-            self.screen.blit(fade_surface, self.logo_rect)
+            self.draw(alpha, fade_surface)
             pygame.display.flip()
             clock.tick(60)
 
@@ -87,9 +93,7 @@ class SplashScreen:
                     return True
 
             # Render
-            self.screen.fill((0, 0, 0))
-            fade_surface.set_alpha(alpha)
-            self.screen.blit(fade_surface, self.logo_rect)
+            self.draw(alpha, fade_surface)
             pygame.display.flip()
             clock.tick(60)
 
@@ -0,0 +1,115 @@
+import json
+import os
+
+ATLAS_DIRS = [
+    'assets/Items',
+    'assets/Details',
+    'assets/Tiles_lava',
+    'assets/Tiles_rock',
+    'assets/Block',
+    'assets/character',
+]
+ATLAS_DIR = 'assets/atlas'
+MANIFEST_PATH = os.path.join(ATLAS_DIR, 'manifest.json')
+
+
+def build_atlases(source_dirs=ATLAS_DIRS, output_dir=ATLAS_DIR, atlas_size=2048, max_image_size=1024, padding=1):
+    """
+    Pack the small PNGs of source_dirs into a few atlas PNGs (build step, needs PIL).
+
+    Images are placed with a simple shelf packer, tallest first. The
+    manifest maps every original path to [atlas file, x, y, width, height].
+    Returns: the manifest dict
+    """
+    from PIL import Image
+
+    images = []
+    for folder in source_dirs:
+        for name in sorted(os.listdir(folder)):
+            if not name.lower().endswith('.png'):
+                continue
+            path = f"{folder}/{name}"
+            image = Image.open(path).convert('RGBA')
+            if image.width > max_image_size or image.height > max_image_size:
+                print(f"Skipping {path}: too large for the atlas")
+                continue
+            images.append((path, image))
+    images.sort(key=lambda item: item[1].height, reverse=True)
+
+    os.makedirs(output_dir, exist_ok=True)
+    sheets = []
+    manifest = {}
+    x = y = shelf_height = 0
+
+    for path, image in images:
+        width, height = image.width + padding, image.height + padding
+        if x + width > atlas_size:
+            # Start a new shelf
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        if not sheets or y + height > atlas_size:
+            # Start a new atlas
+            sheets.append(Image.new('RGBA', (atlas_size, atlas_size), (0, 0, 0, 0)))
+            x = y = shelf_height = 0
+
+        sheets[-1].paste(image, (x, y))
+        manifest[path] = [f"atlas{len(sheets) - 1}.png", x, y, image.width, image.height]
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    for index, sheet in enumerate(sheets):
+        # Trim unused rows at the bottom of the atlas
+        used_height = max(entry[2] + entry[4] for entry in manifest.values() if entry[0] == f"atlas{index}.png")
+        sheet.crop((0, 0, atlas_size, used_height)).save(os.path.join(output_dir, f"atlas{index}.png"))
+
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+
+    print(f"Packed {len(manifest)} images into {len(sheets)} atlases")
+    return manifest
+
+
+class TextureAtlas:
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        """Runtime side of the atlas build; falls back to plain files when it is missing"""
+        self.atlas_dir = os.path.dirname(manifest_path)
+        self.sheets = {}  # atlas file -> pygame surface, loaded on first use
+
+        try:
+            with open(manifest_path, 'r') as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def _get_sheet(self, name):
+        import pygame
+        if name not in self.sheets:
+            sheet = pygame.image.load(os.path.join(self.atlas_dir, name))
+            if pygame.display.get_surface():
+                sheet = sheet.convert_alpha()
+            self.sheets[name] = sheet
+        return self.sheets[name]
+
+    def load_image(self, path):
+        """Drop-in for pygame.image.load returning a subsurface of the packed atlas"""
+        import pygame
+        entry = self.manifest.get(path.replace('\\', '/'))
+        if entry is None:
+            return pygame.image.load(path)
+        name, x, y, width, height = entry
+        return self._get_sheet(name).subsurface((x, y, width, height))
+
+
+_default_atlas = None
+
+
+def load_image(path):
+    """Load an image through the shared default atlas"""
+    global _default_atlas
+    if _default_atlas is None:
+        _default_atlas = TextureAtlas()
+    return _default_atlas.load_image(path)
+
+
+if __name__ == "__main__":
+    build_atlases()
@@ -1,8 +1,42 @@
-import enchant
+import os
+
+BUILD_HINT = ("build it with: python utils/wordlist.py /usr/share/hunspell/en_US.dic {path} "
+              "(any one-word-per-line list works; see README)")
+
 
 class WordChecker:
-    def __init__(self, language="en_US"):
-        self.dictionary = enchant.Dict(language)
+    def __init__(self, language="en_US", backend="enchant", wordlist_path=None):
+        """
+        Args:
+            language: enchant dictionary tag (enchant backend only)
+            backend: "enchant" or "wordlist"
+            wordlist_path: compiled word list file (wordlist backend only)
+        """
+        if backend == "wordlist":
+            from utils.wordlist import CompiledWordList
+            self.require_wordlist(wordlist_path)
+            self.dictionary = CompiledWordList(wordlist_path)
+        elif backend == "enchant":
+            import enchant
+            self.dictionary = enchant.Dict(language)
+        else:
+            raise ValueError(f"Unknown dictionary backend: {backend}")
+
+    @staticmethod
+    def require_wordlist(path):
+        """Raise FileNotFoundError with build instructions if the compiled word list is missing"""
+        if not path or not os.path.exists(path):
+            raise FileNotFoundError(f"Compiled word list {path!r} not found; " + BUILD_HINT.format(path=path))
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a checker from the "dictionary" section of config.json"""
+        settings = config.get("dictionary", {})
+        return cls(
+            language=settings.get("language", "en_US"),
+            backend=settings.get("backend", "enchant"),
+            wordlist_path=settings.get("wordlist"),
+        )
 
     def check_word(self, word):
         """
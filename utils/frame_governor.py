@@ -0,0 +1,80 @@
+from collections import deque
+
+# Quality presets from lowest (0) to full (last). Each step down drops the
+# cheapest-to-lose detail first.
+QUALITY_PRESETS = [
+    {"lava_frame_delay": 160, "animations": False, "background_detail": False},
+    {"lava_frame_delay": 160, "animations": False, "background_detail": True},
+    {"lava_frame_delay": 80, "animations": True, "background_detail": True},
+    {"lava_frame_delay": 40, "animations": True, "background_detail": True},
+]
+
+
+class FrameGovernor:
+    def __init__(self, target_fps, window=60, enabled=True,
+                 downgrade_ratio=0.9, upgrade_ratio=0.5, upgrade_after=180):
+        """
+        Steps quality down when frames run over budget and back up when there is headroom.
+
+        Frame times are the work done per frame (without the sleep in
+        Clock.tick), so a fast machine idling at the target still shows headroom.
+
+        Args:
+            target_fps: configured frame rate; the budget is 1000 / target_fps ms
+            window: number of frames in the rolling window
+            enabled: if False the governor always reports full quality
+            downgrade_ratio: step down when the window's 90th percentile exceeds this share of the budget
+            upgrade_ratio: step up when it stays under this share of the budget...
+            upgrade_after: ...for this many frames in a row
+        """
+        self.target_fps = target_fps
+        self.budget_ms = 1000 / target_fps
+        self.enabled = enabled
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.upgrade_after = upgrade_after
+        self.frame_times = deque(maxlen=window)
+        self.level = len(QUALITY_PRESETS) - 1
+        self.fast_frames = 0
+        self.slow_frame_ms = 0.0  # 90th percentile of the last full window
+
+    @property
+    def preset(self):
+        return QUALITY_PRESETS[self.level]
+
+    def percentile(self, fraction=0.9):
+        """Frame time (ms) at the given fraction of the rolling window"""
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def add_frame(self, frame_ms):
+        """
+        Record one frame's work time; returns True if the quality level changed.
+        """
+        if not self.enabled:
+            return False
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        slow = self.slow_frame_ms = self.percentile(0.9)
+        if slow > self.budget_ms * self.downgrade_ratio and self.level > 0:
+            self._set_level(self.level - 1)
+            return True
+
+        if slow < self.budget_ms * self.upgrade_ratio:
+            self.fast_frames += 1
+            if self.fast_frames >= self.upgrade_after and self.level < len(QUALITY_PRESETS) - 1:
+                self._set_level(self.level + 1)
+                return True
+        else:
+            self.fast_frames = 0
+        return False
+
+    def _set_level(self, level):
+        # Start a fresh window so the next decision only sees frames at the new level
+        self.level = level
+        self.frame_times.clear()
+        self.fast_frames = 0
@@ -0,0 +1,58 @@
+import time
+from collections import deque
+
+
+class KeystrokeLatency:
+    def __init__(self, capacity=2048, clock=time.perf_counter):
+        """
+        Time from a keystroke being handled to the frame showing it being flipped.
+
+        Call keystroke() when an input event changes what is on screen and
+        presented() right after pygame.display.flip(); every keystroke since
+        the previous flip gets one sample.
+
+        Args:
+            capacity: most recent samples kept for the percentiles
+            clock: time source in seconds
+        """
+        self.clock = clock
+        self.pending = []
+        self.samples = deque(maxlen=capacity)
+
+    def keystroke(self, now=None):
+        self.pending.append(self.clock() if now is None else now)
+
+    def presented(self, now=None):
+        if not self.pending:
+            return
+        now = self.clock() if now is None else now
+        self.samples.extend(now - start for start in self.pending)
+        self.pending = []
+
+    def reset(self):
+        self.pending = []
+        self.samples.clear()
+
+    def percentiles(self):
+        """Latency distribution in milliseconds"""
+        if not self.samples:
+            return {"keystrokes": 0}
+        ordered = sorted(self.samples)
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+        return {
+            "keystrokes": len(ordered),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    def report(self):
+        stats = self.percentiles()
+        if stats["keystrokes"]:
+            print(f"Keystroke-to-flip latency over {stats['keystrokes']} keystrokes: "
+                  f"p50 {stats['p50_ms']:.1f} ms, p95 {stats['p95_ms']:.1f} ms, "
+                  f"p99 {stats['p99_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
@@ -0,0 +1,127 @@
+import random
+
+MASK64 = (1 << 64) - 1
+
+
+def _difficulty_order(item):
+    """Sort key for buckets: numbers in numeric order, then text, then no difficulty"""
+    difficulty = item[0]
+    if difficulty is None:
+        return (2, 0, "")
+    if isinstance(difficulty, (int, float)):
+        return (0, difficulty, "")
+    return (1, 0, str(difficulty))
+
+
+class KeyedPermutation:
+    def __init__(self, size, key, rounds=4):
+        """
+        Bijection of range(size) onto itself chosen by key.
+
+        A small Feistel network permutes the next power of four above size;
+        values that land outside range(size) are fed through again
+        (cycle-walking). Nothing proportional to size is stored.
+        """
+        self.size = size
+        half_bits = 1
+        while (1 << (2 * half_bits)) < size:
+            half_bits += 1
+        self.half_bits = half_bits
+        self.half_mask = (1 << half_bits) - 1
+        rng = random.Random(key)
+        self.round_keys = [rng.getrandbits(64) for _ in range(rounds)]
+
+    def _round(self, value, round_key):
+        x = (value * 0x9E3779B97F4A7C15 + round_key) & MASK64
+        x ^= x >> 31
+        x = (x * 0xBF58476D1CE4E5B9) & MASK64
+        x ^= x >> 29
+        return x & self.half_mask
+
+    def _encrypt(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for round_key in self.round_keys:
+            left, right = right, left ^ self._round(right, round_key)
+        return (left << self.half_bits) | right
+
+    def __getitem__(self, position):
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def __len__(self):
+        return self.size
+
+
+class QuestionScheduler:
+    def __init__(self, buckets, seed=None, weights=None, shuffle=True):
+        """
+        Draw question indices without replacement.
+
+        Args:
+            buckets: {difficulty: sequence of question indices}; a range()
+                keeps memory constant however large the bank is
+            seed: makes the order reproducible (replays, server rooms)
+            weights: {difficulty: relative chance of drawing from that bucket};
+                0 leaves the bucket out (unless every bucket would be left out)
+            shuffle: False keeps file order (one bucket, drawn in sequence)
+        """
+        self.weights = weights or {}
+        self.shuffle = shuffle
+        self.buckets = []  # [difficulty, indices, permutation, next position]
+        for difficulty, indices in sorted(buckets.items(), key=_difficulty_order):
+            if len(indices) > 0:
+                self.buckets.append([difficulty, indices, None, 0])
+        weighted = [bucket for bucket in self.buckets if self._weight(bucket[0]) > 0]
+        if weighted:
+            self.buckets = weighted
+        self.total = sum(len(bucket[1]) for bucket in self.buckets)
+        self._build(seed if seed is not None else random.getrandbits(32))
+
+    def _weight(self, difficulty):
+        return self.weights.get(str(difficulty), self.weights.get(difficulty, 1))
+
+    def _build(self, seed):
+        """Derive the draw order from seed and rewind every bucket"""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        for bucket in self.buckets:
+            difficulty, indices = bucket[0], bucket[1]
+            bucket[2] = KeyedPermutation(len(indices), f"{seed}:{difficulty}") if self.shuffle else None
+            bucket[3] = 0
+
+    @classmethod
+    def from_questions(cls, questions, seed=None, weights=None, shuffle=True):
+        """Group an in-memory question list by its optional "difficulty" field"""
+        if not shuffle or not any("difficulty" in question for question in questions):
+            return cls({None: range(len(questions))}, seed, weights, shuffle)
+        buckets = {}
+        for index, question in enumerate(questions):
+            buckets.setdefault(question.get("difficulty"), []).append(index)
+        return cls(buckets, seed, weights, shuffle)
+
+    def next(self):
+        """Return the next question index, or None when every question was drawn"""
+        remaining = [bucket for bucket in self.buckets if bucket[3] < len(bucket[1])]
+        if not remaining:
+            return None
+
+        if len(remaining) == 1:
+            bucket = remaining[0]
+        else:
+            weights = [self._weight(bucket[0]) for bucket in remaining]
+            if not any(weights):
+                weights = None  # every bucket was muted: draw evenly
+            bucket = self.rng.choices(remaining, weights)[0]
+
+        _, indices, permutation, position = bucket
+        bucket[3] += 1
+        return indices[permutation[position] if permutation else position]
+
+    def reset(self, seed=None):
+        """Start over, with a new seed if one is given"""
+        self._build(self.seed if seed is None else seed)
+
+    def __len__(self):
+        return self.total
@@ -0,0 +1,213 @@
+import json
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MAGIC = b"TODR"
+VERSION = 2  # 2 added TEXTINPUT; version 1 files are still read
+
+# Record kinds; every record starts with kind (u8) and ms since the previous record (u16)
+TICK = 0
+MOUSE = 1
+KEYDOWN = 2
+KEYUP = 3
+CLICK = 4
+TEXTINPUT = 5
+
+RECORD_HEAD = struct.Struct("<BH")
+PAYLOADS = {
+    TICK: struct.Struct("<"),
+    MOUSE: struct.Struct("<hh"),      # x, y
+    KEYDOWN: struct.Struct("<II"),    # key, unicode code point (0 = none)
+    KEYUP: struct.Struct("<I"),       # key
+    CLICK: struct.Struct("<Bhh"),     # button, x, y
+    TEXTINPUT: struct.Struct("<B"),   # length of the UTF-8 text that follows
+}
+
+
+class InputRecorder:
+    def __init__(self, path, metadata=None):
+        """
+        Write a compact log of the inputs and ticks of one game session.
+
+        Args:
+            path: output file
+            metadata: JSON-serialisable dict stored in the header
+                (character, screen size...) so the replay can rebuild the session
+        """
+        self.file = open(path, "wb")
+        header = json.dumps(metadata or {}).encode("utf-8")
+        self.file.write(MAGIC + struct.pack("<HI", VERSION, len(header)) + header)
+        self.last_time = None
+        self.mouse_pos = None
+
+    def _write(self, kind, now, *values, data=b""):
+        dt = 0 if self.last_time is None else min(max(now - self.last_time, 0), 0xFFFF)
+        self.last_time = now
+        self.file.write(RECORD_HEAD.pack(kind, dt) + PAYLOADS[kind].pack(*values) + data)
+
+    def record_event(self, event, now):
+        """Record a pygame event handled by GameScreen"""
+        import pygame
+        if event.type == pygame.KEYDOWN:
+            unicode = ord(event.unicode) if len(event.unicode) == 1 else 0
+            self._write(KEYDOWN, now, event.key, unicode)
+        elif event.type == pygame.KEYUP:
+            self._write(KEYUP, now, event.key)
+        elif event.type == pygame.TEXTINPUT:
+            data = event.text.encode("utf-8")[:255]
+            self._write(TEXTINPUT, now, len(data), data=data)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self._write(CLICK, now, event.button, event.pos[0], event.pos[1])
+
+    def record_tick(self, now, mouse_pos):
+        """Record one simulation tick (plus the mouse position when it moved)"""
+        if mouse_pos != self.mouse_pos:
+            self.mouse_pos = mouse_pos
+            self._write(MOUSE, now, mouse_pos[0], mouse_pos[1])
+        self._write(TICK, now)
+
+    def close(self):
+        self.file.close()
+
+
+def read_recording(path):
+    """
+    Read a recording made by InputRecorder
+    Returns: (metadata, list of (kind, absolute ms, values))
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not an input recording")
+    version, header_size = struct.unpack_from("<HI", data, 4)
+    if version not in (1, VERSION):
+        raise ValueError(f"Unsupported recording version {version}")
+
+    pos = 10
+    metadata = json.loads(data[pos:pos + header_size].decode("utf-8"))
+    pos += header_size
+
+    records = []
+    now = 0
+    while pos < len(data):
+        kind, dt = RECORD_HEAD.unpack_from(data, pos)
+        pos += RECORD_HEAD.size
+        payload = PAYLOADS[kind]
+        values = payload.unpack_from(data, pos)
+        pos += payload.size
+        if kind == TEXTINPUT:
+            size = values[0]
+            values = (data[pos:pos + size].decode("utf-8", "replace"),)
+            pos += size
+        now += dt
+        records.append((kind, now, values))
+        if version == 1 and kind == KEYDOWN and values[1] >= 32 and values[1] != 127:
+            # Version 1 predates TEXTINPUT; the typed character came with the key press
+            records.append((TEXTINPUT, now, (chr(values[1]),)))
+    return metadata, records
+
+
+class VirtualClock:
+    """Stand-in for pygame.time.get_ticks driven by recorded timestamps"""
+    def __init__(self):
+        self.now = 0
+
+    def get_ticks(self):
+        return self.now
+
+
+def replay(path, config_path="config.json"):
+    """
+    Feed a recording back through GameScreen as fast as possible.
+    Returns: list of frame times (seconds) for update + render + flip
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from ui.page.game_ui import GameScreen
+    from utils.validator import AnswerValidator
+
+    metadata, records = read_recording(path)
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    if metadata.get("seed") is None:
+        # Recorded before sessions were seeded, when questions were asked in file order
+        config.setdefault("game", {})["shuffle_questions"] = False
+
+    pygame.init()
+    screen = pygame.display.set_mode((int(config["client"]["screen_width"]),
+                                      int(config["client"]["screen_height"])))
+    clock = VirtualClock()
+    mouse = [0, 0]
+
+    game = GameScreen(screen, None, config, 'assets/fonts/Parkinsans-Regular.ttf',
+                      metadata.get("character"), validator=AnswerValidator(0),
+                      get_ticks=clock.get_ticks)
+    game.get_mouse_pos = lambda: tuple(mouse)
+    game.enter(metadata.get("character"), seed=metadata.get("seed"))
+
+    frame_times = []
+    for kind, now, values in records:
+        clock.now = now
+        if kind == TICK:
+            start = time.perf_counter()
+            game.update()
+            game.render()
+            pygame.display.flip()
+            frame_times.append(time.perf_counter() - start)
+            continue
+
+        if kind == MOUSE:
+            mouse[0], mouse[1] = values
+            continue
+        elif kind == KEYDOWN:
+            event = pygame.event.Event(pygame.KEYDOWN, key=values[0], mod=0, scancode=0,
+                                       unicode=chr(values[1]) if values[1] else "")
+        elif kind == TEXTINPUT:
+            event = pygame.event.Event(pygame.TEXTINPUT, text=values[0])
+        elif kind == KEYUP:
+            event = pygame.event.Event(pygame.KEYUP, key=values[0], mod=0, scancode=0, unicode="")
+        else:
+            event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=values[0], pos=values[1:])
+
+        result = game.handle_event(event)
+        if result == "menu" or not result:
+            break
+
+    pygame.quit()
+    return frame_times
+
+
+def summarize(frame_times):
+    """Frame-time distribution in milliseconds"""
+    if not frame_times:
+        return {"frames": 0}
+    ordered = sorted(frame_times)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+    return {
+        "frames": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python utils/replay.py <recording> [stats.json]")
+        sys.exit(1)
+    stats = summarize(replay(sys.argv[1]))
+    for name, value in stats.items():
+        print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w") as f:
+            json.dump(stats, f, indent=4)
@@ -0,0 +1,114 @@
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    character TEXT,
+    score INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    questions INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC, played_at);
+CREATE TABLE IF NOT EXISTS answers (
+    game_id INTEGER NOT NULL REFERENCES games (id),
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_by_game ON answers (game_id);
+"""
+
+
+class ScoreStore:
+    def __init__(self, path, batch_size=100, flush_interval=1.0):
+        """
+        SQLite (WAL) score store written by a background thread.
+
+        record_game() only puts the result on a queue; the writer thread
+        commits queued games in batches, so gameplay never waits on disk.
+
+        Args:
+            path: database file
+            batch_size: most games committed in one transaction
+            flush_interval: seconds the writer waits to fill a batch
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+
+        self.reader = self._connect()
+        self.reader.executescript(SCHEMA)
+
+        # Read once here; record_game() keeps it current without touching the database
+        row = self.reader.execute("SELECT score FROM games ORDER BY score DESC LIMIT 1").fetchone()
+        self.best = row[0] if row else 0
+
+        self.writer_thread = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self.writer_thread.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record_game(self, character, score, won, answers):
+        """
+        Queue a finished game
+
+        Args:
+            answers: list of (question, answer, seconds) for each correct answer
+        """
+        self.best = max(self.best, score)
+        self.queue.put((time.time(), character, score, int(won), list(answers)))
+
+    def _write_loop(self):
+        connection = self._connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                # close() was called; write what came before it and stop
+                batch = batch[:batch.index(None)]
+                running = False
+
+            try:
+                with connection:
+                    for played_at, character, score, won, answers in batch:
+                        cursor = connection.execute(
+                            "INSERT INTO games (played_at, character, score, won, questions) VALUES (?, ?, ?, ?, ?)",
+                            (played_at, character, score, won, len(answers)))
+                        connection.executemany(
+                            "INSERT INTO answers (game_id, question, answer, seconds) VALUES (?, ?, ?, ?)",
+                            [(cursor.lastrowid, question, answer, seconds) for question, answer, seconds in answers])
+            except sqlite3.Error as e:
+                print(f"Could not save {len(batch)} games: {e}")
+        connection.close()
+
+    def top_scores(self, limit=10):
+        """Best games: list of (score, character, played_at), served by the score index"""
+        return self.reader.execute(
+            "SELECT score, character, played_at FROM games ORDER BY score DESC, played_at LIMIT ?",
+            (limit,)).fetchall()
+
+    def best_score(self):
+        """Highest score including games still queued (kept in memory, no query)"""
+        return self.best
+
+    def close(self):
+        """Write everything still queued, then stop the writer"""
+        self.queue.put(None)
+        self.writer_thread.join()
+        self.reader.close()
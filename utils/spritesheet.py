@@ -1,12 +1,80 @@
 import pygame
 
 class SpriteSheet:
+    # Sheets loaded through SpriteSheet.load, shared by path
+    _sheets = {}
+
     def __init__(self,image):
         self.sheet = image
+        # Sliced frame lists keyed by (width, height, scale, colour)
+        self.frame_cache = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load a sheet from disk once and reuse it for every later caller"""
+        if path not in cls._sheets:
+            cls._sheets[path] = cls(pygame.image.load(path))
+        return cls._sheets[path]
+
+    def get_frames(self, width, height, scale, colour=None):
+        """
+        Slice every frame of a horizontal strip once and cache the result.
+
+        Args:
+            width, height: size of one frame in the sheet
+            scale: size multiplier (may be fractional)
+            colour: colorkey to make transparent, or None to keep the sheet's alpha
+        Returns: list of display-converted surfaces
+        """
+        key = (width, height, scale, colour)
+        if key not in self.frame_cache:
+            size = (int(width * scale), int(height * scale))
+            frames = []
+            for frame in range(self.sheet.get_width() // width):
+                if colour is None:
+                    image = self.sheet.subsurface((frame * width, 0, width, height))
+                    image = pygame.transform.scale(image, size).convert_alpha()
+                else:
+                    image = pygame.Surface((width, height)).convert_alpha()
+                    image.blit(self.sheet, (0,0), ((frame * width) , 0, width, height))
+                    image = pygame.transform.scale(image, size).convert()
+                    image.set_colorkey(colour)
+                frames.append(image)
+            self.frame_cache[key] = frames
+        return self.frame_cache[key]
+
     def get_image(self, frame, width, height, scale, colour):
-        image = pygame.Surface((width, height)).convert_alpha()
-        image.blit(self.sheet, (0,0), ((frame * width) , 0, width, height))
-        image = pygame.transform.scale(image, (width * scale, height * scale))
-        image.set_colorkey(colour)
-        
-        return image
\ No newline at end of file
+        return self.get_frames(width, height, scale, colour)[frame]
+
+
+class AnimatedSprite:
+    def __init__(self, frames, frame_duration=100, loop=True, get_ticks=None):
+        """
+        Play a list of pre-sliced frames based on elapsed time.
+
+        Args:
+            frames: surfaces from SpriteSheet.get_frames
+            frame_duration: milliseconds each frame is shown
+            loop: restart after the last frame, otherwise hold it
+            get_ticks: time source (defaults to pygame.time.get_ticks)
+        """
+        self.frames = frames
+        self.frame_duration = frame_duration
+        self.loop = loop
+        self.get_ticks = get_ticks if get_ticks else pygame.time.get_ticks
+        self.start_time = self.get_ticks()
+
+    def restart(self):
+        self.start_time = self.get_ticks()
+
+    @property
+    def frame_index(self):
+        step = (self.get_ticks() - self.start_time) // self.frame_duration
+        if self.loop:
+            return step % len(self.frames)
+        return min(step, len(self.frames) - 1)
+
+    @property
+    def image(self):
+        """Current frame (no surfaces are created here)"""
+        return self.frames[self.frame_index]
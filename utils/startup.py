@@ -0,0 +1,67 @@
+import importlib
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    def __init__(self, enabled=False, start_time=None):
+        """
+        Time imports and init steps of the client up to its first frame.
+
+        When disabled every method still works (imports still happen) but
+        nothing is recorded, so main() can use it unconditionally.
+
+        Args:
+            enabled: record timings
+            start_time: time.perf_counter() value taken when the process started
+        """
+        self.enabled = enabled
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.records = []  # [(kind, name, ms, deferred), ...]
+        self.first_frame_ms = None
+
+    @contextmanager
+    def phase(self, name):
+        """Time an init step"""
+        start = time.perf_counter()
+        yield
+        self._record("init", name, start)
+
+    def import_module(self, name):
+        """Import a module on first use and record how long it took"""
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self._record("import", name, start)
+        return module
+
+    def load(self, module_name, attribute):
+        """Lazily import module_name and return one of its attributes (a page class...)"""
+        return getattr(self.import_module(module_name), attribute)
+
+    def record(self, kind, name, start, end=None):
+        """Record a step timed outside phase()/import_module (e.g. before the profiler existed)"""
+        self._record(kind, name, start, end)
+
+    def _record(self, kind, name, start, end=None):
+        if self.enabled:
+            elapsed = ((end if end is not None else time.perf_counter()) - start) * 1000
+            self.records.append((kind, name, elapsed, self.first_frame_ms is not None))
+
+    def mark_first_frame(self):
+        if self.first_frame_ms is None:
+            self.first_frame_ms = (time.perf_counter() - self.start_time) * 1000
+
+    def report(self, budget_ms):
+        """
+        Print the timings and compare time-to-first-frame with the budget
+        Returns: True if the first frame was within budget
+        """
+        print(f"{'kind':<8}{'name':<52}{'ms':>10}")
+        for kind, name, elapsed, deferred in self.records:
+            label = f"{name} (after first frame)" if deferred else name
+            print(f"{kind:<8}{label:<52}{elapsed:>10.1f}")
+
+        ok = self.first_frame_ms is not None and self.first_frame_ms <= budget_ms
+        status = "OK" if ok else "OVER BUDGET"
+        print(f"time to first frame: {self.first_frame_ms or 0:.1f} ms (budget {budget_ms} ms) {status}")
+        return ok
@@ -0,0 +1,181 @@
+import os
+import sys
+import tracemalloc
+import weakref
+import pygame
+
+THIS_FILE = os.path.abspath(__file__)
+# install() replaces pygame.Surface with a subclass; type checks use the real class
+BaseSurface = pygame.Surface
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceTracker:
+    def __init__(self, growth_threshold=1024 * 1024):
+        """
+        Debug instrumentation for surface memory.
+
+        install() wraps pygame's surface-creating functions so every
+        allocation is recorded with its size and creation site until it is
+        freed. checkpoint() compares live totals and a tracemalloc snapshot
+        with the previous checkpoint and warns when memory keeps growing.
+
+        Args:
+            growth_threshold: bytes of surface growth between checkpoints that
+                is reported as a possible leak
+        """
+        self.growth_threshold = growth_threshold
+        self.live = {}  # id(surface) -> (weakref, bytes, creation site)
+        self.originals = {}
+        self.checkpoints = {}  # label -> (surface bytes, surface count, tracemalloc snapshot) of the latest one
+
+    # Allocation tracking
+
+    def _creation_site(self):
+        """First stack frame outside this module and pygame"""
+        frame = sys._getframe(2)
+        while frame and (os.path.abspath(frame.f_code.co_filename) == THIS_FILE):
+            frame = frame.f_back
+        if frame is None:
+            return "unknown"
+        path = os.path.relpath(frame.f_code.co_filename)
+        return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+
+    def track(self, surface, site=None):
+        """Record a surface until it is garbage collected"""
+        if not isinstance(surface, BaseSurface):
+            return surface
+        key = id(surface)
+        ref = weakref.ref(surface, lambda _, key=key: self.live.pop(key, None))
+        self.live[key] = (ref, surface_bytes(surface), site or self._creation_site())
+        return surface
+
+    def _wrap(self, owner, name):
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+        self.originals[(owner, name)] = original
+        tracker = self
+
+        def wrapper(*args, **kwargs):
+            return tracker.track(original(*args, **kwargs))
+        setattr(owner, name, wrapper)
+
+    def install(self):
+        """Start tracking surfaces created through pygame (call before pages are built)"""
+        tracemalloc.start(10)
+        for name in ("load", "fromstring", "frombytes", "frombuffer"):
+            self._wrap(pygame.image, name)
+        for name in ("scale", "smoothscale", "scale_by", "smoothscale_by", "rotate", "rotozoom", "flip"):
+            self._wrap(pygame.transform, name)
+
+        tracker = self
+        original_surface = pygame.Surface
+        original_font = pygame.font.Font
+
+        class TrackedSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker.track(self)
+
+        class TrackedFont(original_font):
+            def render(self, *args, **kwargs):
+                return tracker.track(super().render(*args, **kwargs))
+
+        self.originals[(pygame, "Surface")] = original_surface
+        self.originals[(pygame.font, "Font")] = original_font
+        pygame.Surface = TrackedSurface
+        pygame.font.Font = TrackedFont
+
+    def uninstall(self):
+        for (owner, name), original in self.originals.items():
+            setattr(owner, name, original)
+        self.originals = {}
+        tracemalloc.stop()
+
+    # Reports
+
+    def live_totals(self):
+        """(bytes, count) of tracked surfaces still alive"""
+        return sum(entry[1] for entry in self.live.values()), len(self.live)
+
+    def by_site(self, limit=10):
+        """Largest creation sites of live surfaces: list of (site, bytes, count)"""
+        sites = {}
+        for _, size, site in self.live.values():
+            total, count = sites.get(site, (0, 0))
+            sites[site] = (total + size, count + 1)
+        ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+        return [(site, total, count) for site, (total, count) in ranked[:limit]]
+
+    def owned_by(self, root):
+        """
+        Bytes and count of surfaces reachable from an object (a page or component).
+
+        Walks instance attributes and containers, so it also counts surfaces
+        that were not created through a tracked function (copies, converts).
+        """
+        # The display surface is shared by every page and not owned by any of them
+        display = pygame.display.get_surface()
+        seen = {id(display)}
+        stack = [root]
+        total = count = 0
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, BaseSurface):
+                total += surface_bytes(obj)
+                count += 1
+            elif isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif hasattr(obj, "__dict__") and not isinstance(obj, type) and not callable(obj):
+                stack.extend(vars(obj).values())
+        return total, count
+
+    def checkpoint(self, label, screens=None):
+        """
+        Print live surface memory (per screen if given) and the growth since
+        the last checkpoint; returns True when the growth looks like a leak.
+
+        Args:
+            label: name of this point (e.g. "menu" after every game)
+            screens: {name: page object} to report per-screen totals
+        """
+        total, count = self.live_totals()
+        snapshot = None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, THIS_FILE),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+        print(f"[memory] {label}: {total / 1024 / 1024:.1f} MB in {count} tracked surfaces")
+        for name, screen in (screens or {}).items():
+            if screen is not None:
+                owned, owned_count = self.owned_by(screen)
+                print(f"[memory]   {name}: {owned / 1024 / 1024:.1f} MB in {owned_count} surfaces")
+
+        leaking = False
+        previous = self.checkpoints.get(label)
+        if previous:
+            growth = total - previous[0]
+            if growth > self.growth_threshold:
+                leaking = True
+                print(f"[memory] WARNING: surfaces grew by {growth / 1024:.0f} KB since the last '{label}'")
+                for site, size, site_count in self.by_site(5):
+                    print(f"[memory]   {size / 1024:.0f} KB in {site_count} surfaces from {site}")
+            if snapshot and previous[2]:
+                for stat in snapshot.compare_to(previous[2], "lineno")[:5]:
+                    if stat.size_diff > 0:
+                        print(f"[memory]   tracemalloc {stat}")
+
+        self.checkpoints[label] = (total, count, snapshot)
+        return leaking
@@ -0,0 +1,175 @@
+import os
+import struct
+import sys
+import threading
+import time
+
+# timestamp, question id, first keystroke ms, answer ms, wrong attempts, lava distance px, outcome
+RECORD = struct.Struct("<dIIIHhBx")
+NO_TIME = 0xFFFFFFFF
+
+OUTCOME_CORRECT = 0
+OUTCOME_TIME_UP = 1
+OUTCOME_LAVA = 2
+OUTCOME_NAMES = {OUTCOME_CORRECT: "correct", OUTCOME_TIME_UP: "time up", OUTCOME_LAVA: "lava"}
+
+
+class AnswerTelemetry:
+    def __init__(self, path, capacity=4096, flush_interval=2.0, max_bytes=8 * 1024 * 1024, backup_count=5):
+        """
+        Per-question timing records kept in a fixed-size ring buffer and
+        appended to a rotating log file by a background thread.
+
+        Args:
+            path: log file (rotated to path.1 ... path.N)
+            capacity: records held in memory; when the writer falls behind
+                new records are dropped instead of blocking the game
+            flush_interval: seconds between background flushes
+            max_bytes: size at which the log file is rotated
+            backup_count: rotated files to keep
+        """
+        self.path = path
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.head = 0  # records written by the game
+        self.tail = 0  # records written to disk
+        self.dropped = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.wake = threading.Event()
+        self.running = True
+        self.writer_thread = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+        self.writer_thread.start()
+
+    def record(self, question_id, first_key_ms, answer_ms, wrong_attempts, lava_distance, outcome):
+        """Append one record (never blocks; drops it if the ring is full)"""
+        if self.head - self.tail >= self.capacity:
+            self.dropped += 1
+            return
+        offset = (self.head % self.capacity) * RECORD.size
+        RECORD.pack_into(self.buffer, offset, time.time(), question_id,
+                         NO_TIME if first_key_ms is None else min(int(first_key_ms), NO_TIME - 1),
+                         NO_TIME if answer_ms is None else min(int(answer_ms), NO_TIME - 1),
+                         min(wrong_attempts, 0xFFFF), max(-32768, min(int(lava_distance), 32767)), outcome)
+        self.head += 1
+        if self.head - self.tail >= self.capacity // 2:
+            self.wake.set()
+
+    def _take_pending(self):
+        """Copy the unflushed part of the ring"""
+        head, tail = self.head, self.tail
+        start, end = tail % self.capacity, head % self.capacity
+        if head - tail == 0:
+            return b"", head
+        if start < end:
+            data = bytes(self.buffer[start * RECORD.size:end * RECORD.size])
+        else:
+            data = bytes(self.buffer[start * RECORD.size:]) + bytes(self.buffer[:end * RECORD.size])
+        return data, head
+
+    def _rotate(self):
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _flush(self):
+        data, head = self._take_pending()
+        if not data:
+            return
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "ab") as f:
+                f.write(data)
+        except OSError as e:
+            print(f"Could not write telemetry: {e}")
+        self.tail = head
+
+    def _write_loop(self):
+        while self.running:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self._flush()
+        self._flush()
+
+    def close(self):
+        """Flush what is left and stop the writer"""
+        self.running = False
+        self.wake.set()
+        self.writer_thread.join()
+
+
+def read_records(paths):
+    """Load records from log files as a NumPy structured array (or a list of tuples without NumPy)"""
+    data = b""
+    for path in paths:
+        with open(path, "rb") as f:
+            data += f.read()
+    data = data[:len(data) - len(data) % RECORD.size]
+
+    try:
+        import numpy as np
+    except ImportError:
+        return list(RECORD.iter_unpack(data))
+
+    dtype = np.dtype([("timestamp", "<f8"), ("question", "<u4"), ("first_key_ms", "<u4"),
+                      ("answer_ms", "<u4"), ("wrong", "<u2"), ("lava_distance", "<i2"),
+                      ("outcome", "u1"), ("pad", "u1")])
+    return np.frombuffer(data, dtype=dtype)
+
+
+def aggregate(paths):
+    """Per-question summary rows: (question, count, answered, median answer ms, mean first key ms, mean wrong, mean lava px)"""
+    records = read_records(paths)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    rows = []
+    if np is not None and not isinstance(records, list):
+        order = np.argsort(records["question"], kind="stable")
+        records = records[order]
+        questions, starts = np.unique(records["question"], return_index=True)
+        for question, group in zip(questions, np.split(records, starts[1:])):
+            answered = group[group["outcome"] == OUTCOME_CORRECT]
+            keyed = group[group["first_key_ms"] != NO_TIME]
+            rows.append((int(question), len(group), len(answered),
+                         float(np.median(answered["answer_ms"])) if len(answered) else float("nan"),
+                         float(keyed["first_key_ms"].mean()) if len(keyed) else float("nan"),
+                         float(group["wrong"].mean()),
+                         float(answered["lava_distance"].mean()) if len(answered) else float("nan")))
+        return rows
+
+    groups = {}
+    for record in records:
+        groups.setdefault(record[1], []).append(record)
+    for question in sorted(groups):
+        group = groups[question]
+        answered = sorted(r[3] for r in group if r[6] == OUTCOME_CORRECT)
+        keyed = [r[2] for r in group if r[2] != NO_TIME]
+        lava = [r[5] for r in group if r[6] == OUTCOME_CORRECT]
+        rows.append((question, len(group), len(answered),
+                     answered[len(answered) // 2] if answered else float("nan"),
+                     sum(keyed) / len(keyed) if keyed else float("nan"),
+                     sum(r[4] for r in group) / len(group),
+                     sum(lava) / len(lava) if lava else float("nan")))
+    return rows
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python utils/telemetry.py <answers.bin> [more logs...]")
+        sys.exit(1)
+    print(f"{'question':>8}{'count':>8}{'answered':>10}{'median ms':>12}{'first key ms':>14}{'wrong':>8}{'lava px':>10}")
+    for row in aggregate(sys.argv[1:]):
+        print(f"{row[0]:>8}{row[1]:>8}{row[2]:>10}{row[3]:>12.0f}{row[4]:>14.0f}{row[5]:>8.2f}{row[6]:>10.1f}")
@@ -0,0 +1,55 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils.checkAns import CheckAns
+
+
+class AnswerValidator:
+    def __init__(self, max_workers=1):
+        """
+        Run answer checks off the main thread.
+
+        Args:
+            max_workers: worker threads; 0 checks inline on submit, which
+                keeps results deterministic (used by tests and replays)
+        """
+        self.executor = ThreadPoolExecutor(max_workers) if max_workers > 0 else None
+        self.pending = []  # [(answer, tag, future), ...] in submission order
+
+    def submit(self, answer, answers, tag=None):
+        """Queue an answer check; the result is returned later by poll()"""
+        check = CheckAns(answer, answers)
+        if self.executor:
+            future = self.executor.submit(check.result)
+        else:
+            future = Future()
+            future.set_result(check.result())
+        self.pending.append((answer, tag, future))
+
+    def poll(self):
+        """
+        Collect finished checks without blocking
+        Returns: list of (answer, tag, is_correct) in submission order
+        """
+        results = []
+        while self.pending and self.pending[0][2].done():
+            answer, tag, future = self.pending.pop(0)
+            try:
+                results.append((answer, tag, future.result()))
+            except Exception as e:
+                print(f"Answer check failed for '{answer}': {e}")
+                results.append((answer, tag, False))
+        return results
+
+    def has_pending(self):
+        return bool(self.pending)
+
+    def cancel(self):
+        """Drop all queued checks; their results are never reported"""
+        for _, _, future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def close(self):
+        """Stop the worker threads"""
+        self.cancel()
+        if self.executor:
+            self.executor.shutdown(wait=False)
@@ -0,0 +1,98 @@
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"TODW"
+VERSION = 1
+HEADER = struct.Struct("<4sII")  # magic, version, word count
+OFFSET = struct.Struct("<I")
+
+
+def compile_wordlist(source_path, output_path):
+    """
+    Compile a plain word list (one word per line) into a sorted blob.
+
+    Hunspell .dic files (e.g. /usr/share/hunspell/en_US.dic, the list
+    enchant itself uses) are accepted too: the leading word count and the
+    "/FLAGS" suffixes are dropped; affix expansions are not generated.
+
+    Layout: header, (count + 1) uint32 offsets, then the words
+    concatenated in byte order so lookups can binary search the file.
+    Returns the number of words written.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    if source_path.endswith(".dic") and lines and lines[0].isdigit():
+        lines = lines[1:]
+    words = {line.split("/", 1)[0].lower() for line in lines}
+    words.discard("")
+    encoded = sorted(word.encode("utf-8") for word in words)
+
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, output_path)
+    return len(encoded)
+
+
+class CompiledWordList:
+    def __init__(self, path):
+        """
+        Memory-map a word list produced by compile_wordlist.
+
+        The file is mapped read-only, so every process that opens the
+        same list shares its pages through the OS page cache.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a compiled word list")
+
+        self.count = count
+        self._offsets_start = HEADER.size
+        self._words_start = HEADER.size + (count + 1) * OFFSET.size
+
+    def _word_at(self, index):
+        """Return the encoded word stored at a sorted index"""
+        start, end = struct.unpack_from("<II", self._map, self._offsets_start + index * OFFSET.size)
+        return self._map[self._words_start + start:self._words_start + end]
+
+    def __contains__(self, word):
+        key = word.strip().lower().encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self.count and self._word_at(lo) == key
+
+    def __len__(self):
+        return self.count
+
+    def check(self, word):
+        """Same signature as enchant.Dict.check"""
+        return word in self
+
+    def close(self):
+        self._map.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python utils/wordlist.py <words.txt|hunspell.dic> <output.words>")
+        sys.exit(1)
+    total = compile_wordlist(sys.argv[1], sys.argv[2])
+    print(f"Compiled {total} words into {sys.argv[2]}")